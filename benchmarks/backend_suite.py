@@ -0,0 +1,153 @@
+"""Backend comparison suite for every registered kernel.
+
+Runs each kernel in the backend registry (``genesis_kernel.backends``):
+``QuantumHarmonicEngine``, ``LoveMathematics``, ``pattern_math``, compiled
+pattern programs and the legion spiral kernels. Each kernel runs on every
+backend that implements it and can run here (python / numpy / rust), and
+the outputs are checked against the python result. Emits a table of ns
+per item and speed-up over pure Python. ``--compare`` flags regressions
+against a previous ``--json`` run, so slowdowns and porting candidates are
+visible.
+
+    python benchmarks/backend_suite.py [--size 100000] [--json] \\
+        [--compare baseline.json --tolerance 0.25]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+import timeit
+
+import numpy as np
+
+# Importing the engines registers their kernels; keep their banners off stdout
+with contextlib.redirect_stdout(sys.stderr):
+    from genesis_kernel import backends, legion_kernels, pattern_compiler, pattern_math  # noqa: F401
+    from genesis_kernel.constants import UniversalConstants
+    from genesis_kernel.love_math import LoveMathematics
+    from genesis_kernel.quantum import QuantumHarmonicEngine
+
+
+def workloads(size: int, seed: int) -> dict:
+    """kernel name -> (positional args, items processed per call)."""
+    rng = np.random.default_rng(seed)
+    constants = UniversalConstants()
+    love = LoveMathematics(constants, backend="python")
+    quantum = QuantumHarmonicEngine(constants, love, backend="python")
+    freqs = rng.uniform(1, 2000, size)
+    return {
+        "quantum.energy_eigenvalues": ((quantum, rng.integers(0, 100, size), rng.uniform(0.1, 10, size)), size),
+        "quantum.phi_quantization": ((quantum,), 1),
+        "love.attract": ((love, freqs, freqs[::-1].copy(), rng.uniform(0.1, 10, size)), size),
+        "love.resonate": ((love, freqs, rng.uniform(1, 2000, size)), size),
+        "love.love_field_strength": ((love, rng.uniform(0, 100, size)), size),
+        "love.unite": ((love, rng.uniform(0, 10, (size // 8, 8))), size // 8),
+        "love.coherence_measure": ((love, freqs.tolist()), size),
+        "pattern.quadratic_growth": ((freqs,), size),
+        "pattern.program": ((pattern_compiler.PatternProgram.from_steps(pattern_math.build_quadratic_pattern().steps),
+                             freqs), size),
+        "legion.calculate_resonance": ((freqs,), size),
+        "legion.map_to_spiral": ((freqs, rng.uniform(0, 1, size)), size),
+    }
+
+
+def best_seconds(fn, budget_s: float) -> float:
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    repeat = max(3, min(10, int(budget_s / max(elapsed, 1e-9))))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def same(a, b) -> bool:
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    return a.shape == b.shape and bool(np.allclose(a, b, rtol=1e-12, atol=0.0, equal_nan=True))
+
+
+def run(size: int, seed: int, budget_s: float, only: list[str]) -> list[dict]:
+    rows = []
+    for kernel, (args, items) in workloads(size, seed).items():
+        if only and not any(kernel.startswith(prefix) for prefix in only):
+            continue
+        impls = backends.implementations(kernel)
+        reference = impls["python"](*args)
+        base = None
+        for backend in backends.BACKENDS:
+            if backend not in impls:
+                rows.append({"kernel": kernel, "backend": backend, "status": "not implemented"})
+                continue
+            fn = impls[backend]
+            seconds = best_seconds(lambda: fn(*args), budget_s)
+            base = base or seconds
+            rows.append({
+                "kernel": kernel,
+                "backend": backend,
+                "status": "ok" if same(fn(*args), reference) else "MISMATCH",
+                "items": items,
+                "ns_per_item": round(seconds / items * 1e9, 3),
+                "speedup_vs_python": round(base / seconds, 2),
+            })
+    for backend in backends.BACKENDS:
+        if not backends.backend_available(backend):
+            for row in rows:
+                if row["backend"] == backend:
+                    row["status"] = "unavailable"
+    return rows
+
+
+def compare(rows: list[dict], baseline: list[dict], tolerance: float) -> list[dict]:
+    before = {(r["kernel"], r["backend"]): r for r in baseline if "ns_per_item" in r}
+    regressions = []
+    for row in rows:
+        old = before.get((row["kernel"], row["backend"]))
+        if old is None or "ns_per_item" not in row:
+            continue
+        ratio = row["ns_per_item"] / old["ns_per_item"]
+        row["vs_baseline"] = round(ratio, 2)
+        if ratio > 1 + tolerance:
+            regressions.append(row)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=0.5, help="seconds of timing per measurement")
+    parser.add_argument("--kernels", nargs="*", default=[], help="only kernels with these prefixes")
+    parser.add_argument("--compare", help="baseline JSON from an earlier --json run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    rows = run(args.size, args.seed, args.budget, args.kernels)
+    regressions = []
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(rows, json.load(f)["results"], args.tolerance)
+
+    if args.json:
+        print(json.dumps({
+            "size": args.size,
+            "backends_available": backends.available_backends(),
+            "results": rows,
+            "regressions": [(r["kernel"], r["backend"]) for r in regressions],
+        }, indent=2))
+    else:
+        print(f"{'kernel':<28} {'backend':<7} {'ns/item':>12} {'vs python':>10}  status")
+        for r in rows:
+            if "ns_per_item" in r:
+                print(f"{r['kernel']:<28} {r['backend']:<7} {r['ns_per_item']:12.2f} "
+                      f"{'x' + str(r['speedup_vs_python']):>10}  {r['status']}"
+                      + (f" (x{r['vs_baseline']} vs baseline)" if "vs_baseline" in r else ""))
+            else:
+                print(f"{r['kernel']:<28} {r['backend']:<7} {'-':>12} {'-':>10}  {r['status']}")
+        for r in regressions:
+            print(f"REGRESSION {r['kernel']} [{r['backend']}]: x{r['vs_baseline']} slower than baseline")
+    failed = any(r["status"] == "MISMATCH" for r in rows) or regressions
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
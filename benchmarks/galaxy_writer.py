@@ -0,0 +1,80 @@
+"""Star-plotting cost of the galaxy SVG writer, legacy vs append-only.
+
+The legacy writer re-reads the whole SVG for every star (O(n^2) per
+session); ``GalaxyWriter`` splices batches in front of the tracked
+``</svg>`` offset. Per-star cost should stay flat as ``n`` grows.
+
+    python benchmarks/galaxy_writer.py [--sizes 1000 4000 16000] [--writer-sizes 100000] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from genesis_kernel.galaxy import SVG_HEADER, GalaxyWriter, star_tag
+
+
+def legacy_append(path: str, x: float, y: float, z: float, text: str) -> None:
+    with open(path, "r+", encoding="utf-8") as f:
+        content = f.read()
+        if "</svg>" in content:
+            f.seek(content.rfind("</svg>"))
+            f.truncate()
+        else:
+            f.seek(0, 2)
+        f.write(star_tag(x, y, z, text))
+        f.write("</svg>")
+
+
+def time_legacy(path: Path, n: int) -> float:
+    path.write_text(SVG_HEADER, encoding="utf-8")
+    start = time.perf_counter()
+    for i in range(n):
+        legacy_append(str(path), i % 50, i % 30, i * 0.1, f"thought {i}")
+    return time.perf_counter() - start
+
+
+def time_writer(path: Path, n: int) -> float:
+    if path.exists():
+        os.remove(path)
+    start = time.perf_counter()
+    with GalaxyWriter(str(path)) as galaxy:
+        for i in range(n):
+            galaxy.add(i % 50, i % 30, i * 0.1, f"thought {i}")
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--writer-sizes", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "galaxy.svg"
+        for n in args.sizes:
+            results.append({"writer": "legacy", "stars": n, "seconds": time_legacy(path, n)})
+        for n in sorted(set(args.sizes) | set(args.writer_sizes)):
+            results.append({"writer": "append-only", "stars": n, "seconds": time_writer(path, n)})
+    for r in results:
+        r["us_per_star"] = round(r["seconds"] / r["stars"] * 1e6, 2)
+        r["seconds"] = round(r["seconds"], 4)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['writer']:<12} {r['stars']:>8} stars {r['seconds']:9.3f} s "
+                  f"{r['us_per_star']:9.2f} us/star")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Import-time regression benchmark for the Genesis Kernel package.
+
+Each target is imported in a fresh interpreter (best of ``--repeat`` runs).
+A target fails when it exceeds its time budget or drags in a heavy module
+it must not need, e.g. ``torch`` for ``UniversalConstants``.
+
+    python benchmarks/import_time.py [--repeat 5] [--scale 1.0] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("torch", "sentence_transformers", "transformers", "networkx", "fastapi")
+
+# name -> (statement, budget in seconds, heavy modules allowed)
+TARGETS = {
+    "package": ("import genesis_kernel", 0.25, ()),
+    "constants": ("from genesis_kernel import UniversalConstants", 0.5, ()),
+    "patterns": ("from genesis_kernel import PatternRegistry", 0.25, ()),
+    "expansions": ("from genesis_kernel import MycelialStressSimulator", 0.5, ()),
+    "kernel": ("from genesis_kernel import GenesisKernel", 2.0, ("networkx",)),
+}
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(repr((elapsed, heavy)))
+"""
+
+
+def measure(statement: str, repeat: int) -> tuple[float, list[str]]:
+    best, heavy = float("inf"), []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip().splitlines()[-1]
+        elapsed, heavy = eval(out)  # noqa: S307 - our own probe output
+        best = min(best, elapsed)
+    return best, heavy
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every time budget")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    results = []
+    for name, (statement, budget, allowed) in TARGETS.items():
+        seconds, heavy = measure(statement, args.repeat)
+        unexpected = [m for m in heavy if m not in allowed]
+        ok = seconds <= budget * args.scale and not unexpected
+        results.append({
+            "target": name,
+            "seconds": round(seconds, 4),
+            "budget": budget * args.scale,
+            "heavy_modules": heavy,
+            "ok": ok,
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            flag = "OK " if r["ok"] else "FAIL"
+            heavy = ", ".join(r["heavy_modules"]) or "-"
+            print(f"{flag} {r['target']:<11} {r['seconds'] * 1000:8.1f} ms "
+                  f"(budget {r['budget'] * 1000:.0f} ms)  heavy: {heavy}")
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
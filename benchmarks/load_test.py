@@ -0,0 +1,97 @@
+"""Load test for the Genesis Kernel service.
+
+Fires concurrent ``POST /synthesis`` requests at a running server
+(``python -m genesis_kernel.server``) and reports latency percentiles and
+throughput, so micro-batching windows can be tuned against real numbers.
+
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 \
+        --requests 2000 --concurrency 64 [--json]
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import statistics
+import threading
+import time
+
+import requests
+
+WORDS = ("Mathematics", "Numbers", "Harmony", "Resonance", "Spiral", "Light", "Pattern", "Growth")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run(url: str, total: int, concurrency: int, timeout: float) -> dict:
+    local = threading.local()
+
+    def one(i: int) -> tuple[float, bool]:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        payload = {
+            "logic_input": WORDS[i % len(WORDS)],
+            "creative_input": WORDS[(i * 7 + 3) % len(WORDS)],
+        }
+        start = time.perf_counter()
+        try:
+            ok = session.post(f"{url}/synthesis", json=payload, timeout=timeout).ok
+        except requests.RequestException:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, range(total)))
+    wall = time.perf_counter() - started
+
+    latencies = [seconds * 1000 for seconds, ok in results if ok]
+    errors = sum(1 for _, ok in results if not ok)
+    report = {
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "rps": round(len(latencies) / wall, 1) if wall else 0.0,
+    }
+    if latencies:
+        report.update({
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "mean_ms": round(statistics.fmean(latencies), 2),
+        })
+    try:
+        report["batching"] = requests.get(f"{url}/health", timeout=timeout).json()["batching"]
+    except (requests.RequestException, ValueError, KeyError):
+        pass
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    report = run(args.url.rstrip("/"), args.requests, args.concurrency, args.timeout)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"requests={report['requests']} concurrency={report['concurrency']} errors={report['errors']}")
+    print(f"throughput: {report['rps']} req/s over {report['wall_s']} s")
+    if "p50_ms" in report:
+        print(f"latency: p50 {report['p50_ms']} ms  p99 {report['p99_ms']} ms  mean {report['mean_ms']} ms")
+    if "batching" in report:
+        print(f"batching: {report['batching']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Routing benchmark for ``MycelialRouter`` on a random weighted mesh.
+
+Builds an ``--nodes`` / ``--edges`` mesh (default 10k nodes, 100k edges),
+then times cold queries, cached repeats, and the incremental path: cutting
+an edge on a cached route and re-querying. Both calm (one shortest path)
+and stressed (edge-disjoint) routing are measured, on each ``--backends``
+(NetworkX dict-of-dicts or the CSR arrays, which also reports its size).
+
+    python benchmarks/mycelial_routing.py [--nodes 10000] [--edges 100000] [--queries 50] \\
+        [--backends networkx csr]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from genesis_kernel.routing import ROUTER_BACKENDS, MycelialRouter
+
+
+def build(nodes: int, edges: int, seed: int, backend: str = "auto") -> MycelialRouter:
+    rng = random.Random(seed)
+    router = MycelialRouter(backend)
+    router.graph.add_nodes_from(range(nodes))
+    # A ring keeps the mesh connected; the rest are random chords
+    ring = ((i, (i + 1) % nodes, rng.uniform(1, 10), rng.uniform(0, 5)) for i in range(nodes))
+    chords = ((rng.randrange(nodes), rng.randrange(nodes), rng.uniform(1, 10), rng.uniform(0, 5))
+              for _ in range(max(edges - nodes, 0)))
+    router.add_edges(ring)
+    router.add_edges(chords)
+    return router
+
+
+def timed(fn, pairs) -> float:
+    start = time.perf_counter()
+    for source, target in pairs:
+        fn(source, target)
+    return (time.perf_counter() - start) / len(pairs) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backends", nargs="+", default=["networkx", "csr"], choices=ROUTER_BACKENDS)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed + 1)
+    pairs = [(rng.randrange(args.nodes), rng.randrange(args.nodes)) for _ in range(args.queries)]
+    results = {"nodes": args.nodes, "edges": None, "backends": {}}
+    for backend in args.backends:
+        start = time.perf_counter()
+        router = build(args.nodes, args.edges, args.seed, backend)
+        results["edges"] = router.graph.number_of_edges()
+        report = {"build_s": round(time.perf_counter() - start, 3)}
+        csr = router.csr_snapshot()
+        if csr is not None:
+            report["csr_mb"] = round(csr.nbytes / 1e6, 2)
+        for label, stress in (("calm", 0.2), ("stressed", 0.8)):
+            route = lambda s, t, stress=stress: router.route(s, t, stress)  # noqa: E731
+            cold = timed(route, pairs)
+            warm = timed(route, pairs)
+            # Cut the first edge of each cached route, then ask again
+            start = time.perf_counter()
+            for source, target in pairs:
+                found = router.route(source, target, stress)
+                if found and len(found[0].path) > 1 and router.graph.has_edge(*found[0].path[:2]):
+                    router.remove_edge(*found[0].path[:2])
+                router.route(source, target, stress)
+            incremental = (time.perf_counter() - start) / len(pairs) * 1000
+            report[label] = {"cold_ms": round(cold, 3), "cached_ms": round(warm, 5),
+                             "cut_and_reroute_ms": round(incremental, 3)}
+        results["backends"][backend] = report
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"mesh: {results['nodes']} nodes, {results['edges']} edges")
+        for backend, report in results["backends"].items():
+            extra = f", CSR {report['csr_mb']} MB" if "csr_mb" in report else ""
+            print(f"[{backend}] built in {report['build_s']:.2f} s{extra}")
+            for label in ("calm", "stressed"):
+                r = report[label]
+                print(f"  {label:<9} cold {r['cold_ms']:8.2f} ms/query  cached {r['cached_ms'] * 1000:8.2f} us/query  "
+                      f"cut+reroute {r['cut_and_reroute_ms']:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
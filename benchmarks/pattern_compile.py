@@ -0,0 +1,66 @@
+"""Throughput of compiled ``PatternTransformation`` pipelines per backend.
+
+Compiles ``build_quadratic_pattern()`` (and an optional longer step list)
+on every available backend, checks each result bit-for-bit against the
+scalar interpreter, and reports inputs per second plus the one-off compile
+cost versus a cached lookup.
+
+    python benchmarks/pattern_compile.py [--n 1000000] [--steps receive square add-original ...]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from genesis_kernel import backends
+from genesis_kernel.pattern_compiler import _compile, compile_pattern
+from genesis_kernel.pattern_math import PatternTransformation, build_quadratic_pattern
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--steps", nargs="+", help="extra pattern to time, as step names")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = np.random.default_rng(0).normal(0, 100, args.n)
+    patterns = [build_quadratic_pattern()]
+    if args.steps:
+        patterns.append(PatternTransformation(name="custom", steps=args.steps))
+
+    failed = False
+    for pattern in patterns:
+        print(pattern.describe())
+        sample = values[:20_000]
+        program = compile_pattern(pattern, "python").program
+        reference = np.array([program.run_scalar(v) for v in sample.tolist()])
+        for backend in backends.available_backends():
+            _compile.cache_clear()
+            start = time.perf_counter()
+            fn = pattern.compile(backend)
+            compile_s = time.perf_counter() - start
+            start = time.perf_counter()
+            pattern.compile(backend)
+            cached_s = time.perf_counter() - start
+            data = sample if backend == "python" else values
+            fn(data[:16])  # warm per-program state (plans, bytecode)
+            best = min(_timed(fn, data) for _ in range(args.repeat))
+            ok = np.array_equal(fn(sample), reference)
+            failed |= not ok
+            print(f"  {backend:<7} {data.size / best / 1e6:9.1f} M inputs/s  compile {compile_s * 1e6:7.1f} us  "
+                  f"cached {cached_s * 1e6:5.1f} us  {'ok' if ok else 'MISMATCH'}")
+    return 1 if failed else 0
+
+
+def _timed(fn, data) -> float:
+    start = time.perf_counter()
+    fn(data)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sys.exit(main())
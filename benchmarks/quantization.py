@@ -0,0 +1,70 @@
+"""Recall versus size for the float32 / float16 / int8 embedding modes.
+
+Runs ``recall_tradeoff`` on ``--rows`` synthetic embeddings (clustered, like
+sentence vectors, rather than uniform noise) and times one full-scan query
+per mode, so the memory saving can be weighed against recall@k and speed.
+
+    python benchmarks/quantization.py [--rows 100000] [--dim 384] [--queries 100] [--k 10] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+
+import numpy as np
+
+with contextlib.redirect_stdout(sys.stderr):
+    from genesis_kernel.quantization import quantize, recall_tradeoff
+
+
+def embeddings(rows: int, dim: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centres = rng.standard_normal((clusters, dim), dtype=np.float32)
+    return centres[rng.integers(0, clusters, rows)] + 0.5 * rng.standard_normal((rows, dim), dtype=np.float32)
+
+
+def scan_ms(vectors: np.ndarray, query: np.ndarray, mode: str, repeat: int = 5) -> float:
+    stored = quantize(vectors, mode)
+    stored.dot(query)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stored.dot(query)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = embeddings(args.rows, args.dim, args.clusters, rng)
+    queries = embeddings(args.queries, args.dim, args.clusters, rng)
+    report = recall_tradeoff(vectors, queries, k=args.k)
+    for row in report:
+        row["scan_ms"] = scan_ms(vectors, queries[0], row["mode"])
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{args.rows} x {args.dim}, {args.queries} queries")
+    print(f"{'mode':<8} {'bytes/vec':>10} {'x smaller':>10} {f'recall@{args.k}':>10} "
+          f"{'max err':>10} {'scan ms':>9}")
+    for row in report:
+        print(f"{row['mode']:<8} {row['bytes_per_vector']:>10.0f} {row['compression']:>10.2f} "
+              f"{row[f'recall@{args.k}']:>10.3f} {row['max_score_error']:>10.4f} {row['scan_ms']:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Where the Rust quantum kernels win: scalar FFI calls vs NumPy vs Rust batches.
+
+Times ``E_n = hbar * omega * (n + 1/2)`` four ways: a Python loop, a loop of
+scalar ``QuantumEngineRS.energy_eigenvalue`` calls, the NumPy expression,
+and the zero-copy ``energy_eigenvalue_batch``. Prints ns per state for each
+batch size and checks the Rust results match NumPy.
+
+    python benchmarks/quantum_batch.py [--sizes 16 256 4096 65536 1048576] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+
+import numpy as np
+
+from genesis_kernel.constants import UniversalConstants
+from genesis_kernel import backends, quantum
+
+SCALAR_LIMIT = 65_536  # per-item Python loops get too slow to be worth timing
+
+
+def best_ns(fn, n_items: int, budget_s: float = 0.2) -> float:
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    repeat = max(1, min(7, int(budget_s / max(elapsed, 1e-9))))
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return best / n_items * 1e9
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 256, 4096, 65536, 1_048_576])
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    if not quantum.RUST_AVAILABLE:
+        print("legion_core_rs is not built; run `maturin develop --release` first.", file=sys.stderr)
+        return 2
+    hbar = UniversalConstants().HBAR
+    rs = backends.rust_module().QuantumEngineRS()
+    rng = np.random.default_rng(0)
+
+    results = []
+    for size in args.sizes:
+        levels = rng.integers(0, 100, size, dtype=np.int64)
+        omegas = rng.uniform(0.1, 10.0, size)
+        out = np.empty(size)
+        row = {"size": size}
+        if size <= SCALAR_LIMIT:
+            pairs = list(zip(levels.tolist(), omegas.tolist()))
+            row["python_loop"] = best_ns(lambda: [hbar * w * (n + 0.5) for n, w in pairs], size)
+            row["rust_scalar_loop"] = best_ns(lambda: [rs.energy_eigenvalue(n, w) for n, w in pairs], size)
+        row["numpy"] = best_ns(lambda: hbar * omegas * (levels + 0.5), size)
+        row["rust_batch"] = best_ns(lambda: rs.energy_eigenvalue_batch(levels, omegas, out), size)
+        rs.energy_eigenvalue_batch(levels, omegas, out)
+        row["parity"] = bool(np.array_equal(out, hbar * omegas * (levels + 0.5)))
+        results.append(row)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        columns = ("python_loop", "rust_scalar_loop", "numpy", "rust_batch")
+        print(f"{'size':>9} " + " ".join(f"{c:>17}" for c in columns) + "  (ns/state)")
+        for row in results:
+            cells = " ".join(f"{row[c]:17.2f}" if c in row else f"{'-':>17}" for c in columns)
+            print(f"{row['size']:>9} {cells}  parity={'OK' if row['parity'] else 'FAIL'}")
+    return 0 if all(r["parity"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
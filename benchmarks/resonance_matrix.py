@@ -0,0 +1,54 @@
+"""Throughput and peak memory of the blocked all-pairs resonance engine.
+
+Runs ``ResonanceMatrixEngine.top_k`` (and optionally ``to_memmap``) over N
+random frequencies and reports pairs per second plus the peak traced
+allocation, which should depend on ``--tile`` and not on ``--n``.
+
+    python benchmarks/resonance_matrix.py [--n 20000] [--tile 2048] [--workers 1] [--memmap out.npy]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+with contextlib.redirect_stdout(sys.stderr):
+    from genesis_kernel.constants import UniversalConstants
+    from genesis_kernel.love_math import LoveMathematics
+    from genesis_kernel.resonance_matrix import ResonanceMatrixEngine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=20_000)
+    parser.add_argument("--tile", type=int, default=2048)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--memmap", help="also write the full matrix to this .npy file")
+    args = parser.parse_args()
+
+    freqs = np.random.default_rng(0).uniform(1, 2000, args.n)
+    engine = ResonanceMatrixEngine(LoveMathematics(UniversalConstants()), args.tile, args.workers)
+    runs = [("top_k", lambda: engine.top_k(freqs, args.k))]
+    if args.memmap:
+        runs.append(("to_memmap", lambda: engine.to_memmap(freqs, args.memmap)))
+
+    print(f"N={args.n} tile={args.tile} workers={args.workers} (dense float64 would be {args.n ** 2 * 8 / 1e6:.0f} MB)")
+    for name, fn in runs:
+        tracemalloc.start()
+        start = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<10} {seconds:8.2f} s  {args.n ** 2 / seconds / 1e6:8.1f} M pairs/s  "
+              f"peak {peak / 1e6:7.1f} MB (this process)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Top-k node selection for ``mycelial_route_optimize``: full sort vs heap vs argpartition.
+
+Times picking the best ``--k`` of ``--n`` telemetry nodes three ways: the
+old ``sorted(...)[:k]``, the heap path (``heapq.nlargest`` over a
+generator, which never materialises the stream) and ``argpartition`` on a
+value array. Also reports the peak traced memory of each.
+
+    python benchmarks/route_selection.py [--n 1000000] [--k 15]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from genesis_kernel.selection import top_k, top_k_indices
+
+
+def telemetry(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    for chunk in range(0, n, 65_536):
+        values = rng.integers(0, 1_000_000, min(65_536, n - chunk)).tolist()
+        for offset, value in enumerate(values):
+            yield {"id": chunk + offset, "value": value}
+
+
+def measure(fn) -> tuple[float, float, list]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--k", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    values = np.array([node["value"] for node in telemetry(args.n, args.seed)], dtype=np.float64)
+    by_value = lambda node: node["value"]  # noqa: E731
+    runs = {
+        "sorted (baseline)": lambda: [n["id"] for n in sorted(telemetry(args.n, args.seed), key=by_value,
+                                                              reverse=True)[:args.k]],
+        "heap over stream": lambda: [n["id"] for n in top_k(telemetry(args.n, args.seed), args.k, key=by_value)],
+        "argpartition": lambda: top_k_indices(values, args.k).tolist(),
+    }
+    reference = None
+    print(f"n={args.n} k={args.k}")
+    for name, fn in runs.items():
+        seconds, peak, result = measure(fn)
+        reference = reference or result
+        status = "ok" if result == reference else "MISMATCH"
+        print(f"{name:<20} {seconds * 1000:10.1f} ms  peak {peak / 1e6:8.2f} MB  {status}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
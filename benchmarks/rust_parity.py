@@ -0,0 +1,73 @@
+"""Parity check of the ``legion_core_rs`` kernels against the Python reference.
+
+Every Rust entry point is compared with its reference in
+``genesis_kernel.legion_kernels`` (scalar and batch, random and edge-case
+inputs). Build the extension first with ``maturin develop --release``.
+
+    python benchmarks/rust_parity.py [--n 100000] [--seed 0] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from genesis_kernel import backends, legion_kernels as ref
+
+RTOL = 1e-12
+ATOL = 1e-9
+
+
+def cases(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    freqs = np.concatenate([[0.0, 16.18, 1e-12, 1e6], rng.uniform(0, 2000, n)])
+    angles = np.concatenate([[0.0, 0.5, 0.999999, 0.25], rng.uniform(0, 1, n)])
+    return freqs, angles
+
+
+def check(name: str, got, want) -> dict:
+    got, want = np.asarray(got, dtype=np.float64), np.asarray(want, dtype=np.float64)
+    ok = got.shape == want.shape and bool(np.allclose(got, want, rtol=RTOL, atol=ATOL))
+    err = float(np.abs(got - want).max()) if got.shape == want.shape and got.size else 0.0
+    return {"check": name, "ok": ok, "max_abs_error": err}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    if not backends.RUST_AVAILABLE:
+        print("legion_core_rs is not built; run `maturin develop --release` first.", file=sys.stderr)
+        return 2
+    rust = backends.rust_module()
+
+    freqs, angles = cases(args.n, args.seed)
+    resonances = np.array([ref.calculate_resonance(f) for f in freqs.tolist()])
+    spiral = np.array([ref.map_to_spiral(r, a) for r, a in zip(resonances.tolist(), angles.tolist())])
+
+    results = [
+        check("calculate_resonance", [rust.calculate_resonance(f) for f in freqs.tolist()], resonances),
+        check("calculate_resonance_batch", ref.calculate_resonance_batch(freqs, backend="rust"), resonances),
+        check("calculate_resonance_batch[numpy]", ref.calculate_resonance_batch(freqs, backend="numpy"), resonances),
+        check("map_to_spiral", [rust.map_to_spiral(r, a) for r, a in zip(resonances.tolist(), angles.tolist())], spiral),
+        check("map_to_spiral_batch", ref.map_to_spiral_batch(resonances, angles, backend="rust"), spiral),
+        check("map_to_spiral_batch[numpy]", ref.map_to_spiral_batch(resonances, angles, backend="numpy"), spiral),
+        check("map_to_spiral_batch[python]", ref.map_to_spiral_batch(resonances, angles, backend="python"), spiral),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            flag = "OK " if r["ok"] else "FAIL"
+            print(f"{flag} {r['check']:<34} max |err| {r['max_abs_error']:.3e}")
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Thread scaling of the GIL-releasing ``legion_core_rs`` batch kernels.
+
+Each of ``T`` pool threads repeatedly calls one batch kernel on its own
+array. The kernels run inside ``allow_threads``, so throughput should grow
+close to linearly with ``T`` up to the core count; a kernel that held the
+GIL would stay flat. ``--single`` also times one large call, which spreads
+across Rayon threads when the crate is built with ``--features parallel``,
+while a pure-Python thread counts how far it gets during the call (it
+stalls at zero if the kernel holds the GIL, even on a single core).
+
+    python benchmarks/rust_threads.py [--threads 1 2 4 8] [--size 262144] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from genesis_kernel import backends
+
+
+def kernels(rust, size: int):
+    rng = np.random.default_rng(0)
+    freqs = rng.uniform(0, 2000, size)
+    angles = rng.uniform(0, 1, size)
+    levels = rng.integers(0, 100, size, dtype=np.int64)
+    engine = rust.QuantumEngineRS()
+    omega = np.array([1.0])
+    return {
+        "map_to_spiral_batch": lambda out: rust.map_to_spiral_batch(freqs, angles, out),
+        "energy_eigenvalue_batch": lambda out: engine.energy_eigenvalue_batch(levels, omega, out),
+        "quadratic_growth_batch": lambda out: rust.PatternEngineRS.quadratic_growth_batch(freqs, out),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--size", type=int, default=262_144)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--single", type=int, default=4_194_304, help="size of the one-call run (0 to skip)")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    if not backends.RUST_AVAILABLE:
+        print("legion_core_rs is not built; run `maturin develop --release` first.", file=sys.stderr)
+        return 2
+    rust = backends.rust_module()
+    size = args.size
+    buffers = {
+        "map_to_spiral_batch": lambda: np.empty((size, 3)),
+        "energy_eigenvalue_batch": lambda: np.empty(size),
+        "quadratic_growth_batch": lambda: np.empty((size, 5)),
+    }
+
+    results = []
+    for name, kernel in kernels(rust, size).items():
+        base = None
+        for threads in args.threads:
+            outs = [buffers[name]() for _ in range(threads)]
+
+            def work(out, kernel=kernel):
+                for _ in range(args.calls):
+                    kernel(out)
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(work, outs))
+            rate = threads * args.calls * size / (time.perf_counter() - start)
+            base = base or rate
+            results.append({
+                "kernel": name,
+                "threads": threads,
+                "items_per_sec": round(rate),
+                "speedup": round(rate / base, 2),
+                "efficiency": round(rate / base / threads, 2),
+            })
+
+    single = None
+    if args.single:
+        big = np.random.default_rng(1).uniform(0, 2000, args.single)
+        out = np.empty((args.single, 3))
+        ticks, done = [0], threading.Event()
+
+        def spin():
+            while not done.is_set():
+                ticks[0] += 1
+
+        spinner = threading.Thread(target=spin)
+        spinner.start()
+        time.sleep(0.05)
+        before = ticks[0]
+        start = time.perf_counter()
+        rust.map_to_spiral_batch(big, big / 2000, out)
+        seconds = time.perf_counter() - start
+        during = ticks[0] - before
+        done.set()
+        spinner.join()
+        single = {"kernel": "map_to_spiral_batch", "size": args.single,
+                  "seconds": round(seconds, 4), "python_ticks_during_call": during}
+
+    report = {"cpu_count": os.cpu_count(), "size": size, "threaded": results, "single_call": single}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"cpus: {os.cpu_count()}  items per call: {size}")
+        for r in results:
+            print(f"{r['kernel']:<24} threads={r['threads']:<3} {r['items_per_sec'] / 1e6:9.1f} M items/s "
+                  f"x{r['speedup']:<5} efficiency {r['efficiency']:.2f}")
+        if single:
+            print(f"single call ({single['size']} items): {single['seconds'] * 1000:.1f} ms, "
+                  f"python thread ticks during call: {single['python_ticks_during_call']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Capacity-planning sweep of mycelial routing across stress levels.
+
+Runs ``MycelialStressSimulator.sweep`` (seeded random meshes routed at every
+stress level, spread over a process pool) and prints per-level path length,
+route count and compute-time distributions. ``--checkpoint`` makes long
+sweeps resumable; rerun the same command after an interruption.
+
+    python benchmarks/stress_sweep.py [--stress 0 0.25 0.5 0.75 1] [--topologies 8] \\
+        [--nodes 10000] [--edges 100000] [--workers 4] [--checkpoint sweep.npz] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from genesis_kernel.expansions.mycelial_simulator import MycelialStressSimulator
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stress", type=float, nargs="+", default=[0.0, 0.25, 0.5, 0.75, 1.0])
+    parser.add_argument("--topologies", type=int, default=8)
+    parser.add_argument("--nodes", type=int, default=1_000)
+    parser.add_argument("--edges", type=int, default=5_000)
+    parser.add_argument("--queries", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--checkpoint", help="resumable .npz checkpoint")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    sim = MycelialStressSimulator()
+    start = time.perf_counter()
+    results = sim.sweep(args.stress, args.topologies, args.nodes, args.edges, args.queries,
+                        seed=args.seed, workers=args.workers, checkpoint=args.checkpoint)
+    rows = sim.summarize(results)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps({"seconds": round(elapsed, 3), "levels": rows}, indent=2))
+    else:
+        print(f"{args.topologies} meshes x {args.nodes} nodes / {args.edges} edges, "
+              f"{args.queries} queries each, {args.workers} workers: {elapsed:.2f} s")
+        print(f"{'stress':>6} {'redund':>6} {'hops p50/p95':>14} {'routes':>7} {'ms p50/p95':>16}")
+        for r in rows:
+            print(f"{r['stress']:6.2f} {r['redundancy']:6d} "
+                  f"{r.get('path_length_p50', float('nan')):6.1f}/{r.get('path_length_p95', float('nan')):<7.1f} "
+                  f"{r.get('route_count_mean', 0.0):7.2f} "
+                  f"{r.get('compute_ms_p50', float('nan')):7.2f}/{r.get('compute_ms_p95', float('nan')):<8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Query latency of the ThoughtIndex at Oubliette scale (exact and IVF).
+
+Fills an index with ``--rows`` random unit vectors (default 1M x 384, the
+MiniLM width), then times ``search`` for random queries: an exact chunked
+scan and, after ``build_ivf``, an IVF probe. Pass ``--dir`` to keep the
+index and reuse it on the next run. A small reopen-after-crash check runs
+first: rows left by an ``add`` interrupted before its ids were written must
+not shift the rows added after reopening.
+
+    python benchmarks/thought_index.py [--rows 1000000] [--dtype float32] [--n-lists 1024] [--n-probe 8]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+with contextlib.redirect_stdout(sys.stderr):
+    from genesis_kernel.quantization import quantize
+    from genesis_kernel.thought_index import DTYPES, ThoughtIndex
+
+
+def fill(index: ThoughtIndex, rows: int, seed: int, batch: int = 100_000) -> None:
+    rng = np.random.default_rng(seed)
+    for start in range(len(index), rows, batch):
+        count = min(batch, rows - start)
+        vectors = rng.standard_normal((count, index.dim), dtype=np.float32)
+        index.add([f"t{i}" for i in range(start, start + count)], vectors)
+
+
+def check_partial_write(dim: int, dtype: str) -> bool:
+    """Crash an ``add`` after its vector write (ids never land), reopen, and add."""
+    vectors = np.random.default_rng(0).standard_normal((4, dim), dtype=np.float32)
+    with tempfile.TemporaryDirectory() as directory:
+        index = ThoughtIndex(directory, dim=dim, dtype=dtype)
+        index.add(["a", "b"], vectors[:2])
+        orphans = quantize(vectors[2:3], dtype)  # one full row plus half of the next
+        with open(index.vectors_path, "ab") as f:
+            f.write(orphans.data.tobytes() + orphans.data.tobytes()[: orphans.data.nbytes // 2])
+        if orphans.scales is not None:
+            with open(index.scales_path, "ab") as f:
+                f.write(orphans.scales.tobytes())
+        with contextlib.redirect_stdout(sys.stderr):
+            index = ThoughtIndex(directory)
+        index.add(["c"], vectors[3:4])
+        # Every id must find its own vector, not a neighbour's row
+        for sid, vector in zip(("a", "b", "c"), vectors[[0, 1, 3]]):
+            (hit, score), = index.search(vector, k=1)
+            if hit != sid or score < 0.99:
+                return False
+        return len(index) == 3
+
+
+def latency(index: ThoughtIndex, queries: np.ndarray, k: int, n_probe=None) -> np.ndarray:
+    index.search(queries[0], k, n_probe=n_probe)  # page the matrix in once
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, k, n_probe=n_probe)
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--dtype", choices=DTYPES, default="float32")
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--n-lists", type=int, default=1024)
+    parser.add_argument("--n-probe", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dir", help="index directory to build or reuse (default: a temp dir)")
+    args = parser.parse_args()
+
+    ok = check_partial_write(args.dim, args.dtype)
+    print(f"reopen after partial write: {'ok' if ok else 'MISALIGNED'}")
+
+    with contextlib.ExitStack() as stack:
+        directory = args.dir or stack.enter_context(tempfile.TemporaryDirectory())
+        index = ThoughtIndex(directory, dim=args.dim, dtype=args.dtype)
+        start = time.perf_counter()
+        fill(index, args.rows, args.seed)
+        print(f"{len(index)} x {index.dim} {index.dtype.name}: {index.stats()['bytes'] / 1e6:.0f} MB, "
+              f"filled in {time.perf_counter() - start:.1f} s")
+
+        queries = np.random.default_rng(args.seed + 1).standard_normal(
+            (args.queries, index.dim), dtype=np.float32)
+        results = [("exact", latency(index, queries, args.k))]
+        if args.n_probe:
+            start = time.perf_counter()
+            index.build_ivf(n_lists=args.n_lists, seed=args.seed)
+            print(f"build_ivf({args.n_lists} lists) in {time.perf_counter() - start:.1f} s")
+            results.append((f"ivf n_probe={args.n_probe}",
+                            latency(index, queries, args.k, n_probe=args.n_probe)))
+        for name, ms in results:
+            p50, p95 = np.percentile(ms, [50, 95])
+            print(f"{name:<16} p50 {p50:8.1f} ms  p95 {p95:8.1f} ms  ({args.queries} queries, k={args.k})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,63 +1,97 @@
-"""Genesis Kernel package exports."""
+"""Genesis Kernel package exports.
 
-from .app import GenesisKernel, initiate_genesis
-from .aether import AetherProtocol
-from .bio import BioSystemEngine
-from .constants import UniversalConstants
-from .love_math import LoveMathematics
-from .nervous_system import NervousSystemIO, NervousSystemDriver
-from .expansions import (
-    Base144kSolver,
-    Base144kTranslator,
-    BioCompassionWatchdog,
-    BioUnificationMath,
-    ChaosTestHarness,
-    ChronoCompass,
-    CoherenceExpander,
-    DodecaVault,
-    GorgonProtocol,
-    GlyphMultiplier,
-    HeartKey,
-    HeartbeatSync,
-    HumanAnchorInterface,
-    LeyLineTest,
-    LivingDesktop,
-    MissionSimulator,
-    MycelialStressSimulator,
-    OubliettePolicy,
-    OmegaBuffer,
-    PhiTimeClock,
-    ProofOfUseAPI,
-    PoincareMap,
-    PrismEncoder,
-    QuantumPatternTagger,
-    SonicScrub,
-    TheoremEngine,
-    ToroidalField,
-    VesicaDetector,
-    WatchdogPolicy,
-    AxiomProofEngine,
-)
-from .pattern_math import (
-    PatternComposition,
-    PatternRegistry,
-    PatternTransformation,
-    StructuralProperty,
-    build_quadratic_pattern,
-    compose_patterns,
-    pattern_associativity,
-    pattern_commutativity,
-    pattern_distributivity,
-    summarize_properties,
+Submodules are imported lazily on first attribute access, so importing the
+package (or a light export such as ``UniversalConstants``) does not pull in
+the neural stack.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_EXPANSIONS = (
+    "Base144kSolver",
+    "Base144kTranslator",
+    "BioCompassionWatchdog",
+    "BioUnificationMath",
+    "ChaosTestHarness",
+    "ChronoCompass",
+    "CoherenceExpander",
+    "DodecaVault",
+    "GorgonProtocol",
+    "GlyphMultiplier",
+    "HeartKey",
+    "HeartbeatSync",
+    "HumanAnchorInterface",
+    "LeyLineTest",
+    "LivingDesktop",
+    "MissionSimulator",
+    "MycelialStressSimulator",
+    "OubliettePolicy",
+    "OmegaBuffer",
+    "PhiTimeClock",
+    "ProofOfUseAPI",
+    "PoincareMap",
+    "PrismEncoder",
+    "QuantumPatternTagger",
+    "SonicScrub",
+    "TheoremEngine",
+    "ToroidalField",
+    "VesicaDetector",
+    "WatchdogPolicy",
+    "AxiomProofEngine",
 )
-from .nervous_system import NervousSystemIO
-from .quantum import QuantumHarmonicEngine
+
+_EXPORTS = {
+    "GenesisKernel": ".app",
+    "initiate_genesis": ".app",
+    "AetherProtocol": ".aether",
+    "BioSystemEngine": ".bio",
+    "UniversalConstants": ".constants",
+    "LoveMathematics": ".love_math",
+    "ResonanceMatrixEngine": ".resonance_matrix",
+    "MycelialRouter": ".routing",
+    "CSRGraph": ".csr_graph",
+    "NervousSystemIO": ".nervous_system",
+    "NervousSystemDriver": ".nervous_system",
+    **{name: ".expansions" for name in _EXPANSIONS},
+    "PatternComposition": ".pattern_math",
+    "PatternRegistry": ".pattern_math",
+    "PatternTransformation": ".pattern_math",
+    "CompiledPattern": ".pattern_compiler",
+    "compile_pattern": ".pattern_compiler",
+    "register_step": ".pattern_compiler",
+    "StructuralProperty": ".pattern_math",
+    "build_quadratic_pattern": ".pattern_math",
+    "compose_patterns": ".pattern_math",
+    "pattern_associativity": ".pattern_math",
+    "pattern_commutativity": ".pattern_math",
+    "pattern_distributivity": ".pattern_math",
+    "summarize_properties": ".pattern_math",
+    "QuantumHarmonicEngine": ".quantum",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # resolve once; later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "AetherProtocol",
     "BioSystemEngine",
     "GenesisKernel",
     "LoveMathematics",
+    "ResonanceMatrixEngine",
+    "MycelialRouter",
+    "CSRGraph",
     "NervousSystemIO",
     "NervousSystemDriver",
     "BioCompassionWatchdog",
@@ -93,6 +127,9 @@ __all__ = [
     "PatternComposition",
     "PatternRegistry",
     "PatternTransformation",
+    "CompiledPattern",
+    "compile_pattern",
+    "register_step",
     "StructuralProperty",
     "QuantumHarmonicEngine",
     "UniversalConstants",
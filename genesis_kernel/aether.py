@@ -3,20 +3,27 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import hashlib
-from typing import Dict, Optional
+import importlib.util
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-# 🧠 NEURAL IMPORTS
 try:
-    from sentence_transformers import SentenceTransformer, util
-    NEURAL_AVAILABLE = True
-except ImportError:
-    NEURAL_AVAILABLE = False
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+# 🧠 NEURAL IMPORTS (deferred: sentence_transformers pulls in torch)
+NEURAL_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
 
 from .bio import BioSystemEngine
 from .constants import UniversalConstants
+from .embedding_cache import EmbeddingCache
 from .nervous_system import NervousSystemIO
 from .quantum import QuantumHarmonicEngine
 from .memory import Oubliette  # <--- NEW IMPORT
+from .thought_index import ThoughtIndex
+
+MODEL_NAME = "all-MiniLM-L6-v2"
 
 @dataclass
 class AetherProtocol:
@@ -34,17 +41,70 @@ class AetherProtocol:
     coherence: float = 1.0
     minimum_resonance: float = 0.4
     last_resonance: float = 0.0
+    embedding_cache: Optional[EmbeddingCache] = None
+    thought_index: Optional[ThoughtIndex] = None
+    warm_start: bool = False
     
     _model: Optional[object] = field(init=False, default=None)
+    _neural: bool = field(init=False, default=NEURAL_AVAILABLE, repr=False)  # False once loading fails
+    _model_lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
 
     def __post_init__(self):
-        """Load the Neural Network into RAM on startup."""
-        if NEURAL_AVAILABLE:
-            print("🧠 LOADING NEURAL VECTORS (all-MiniLM-L6-v2)...")
-            self._model = SentenceTransformer('all-MiniLM-L6-v2')
+        """Prepare the neural engine; the network loads on first use."""
+        if self._neural:
+            if self.embedding_cache is None:
+                self.embedding_cache = EmbeddingCache(MODEL_NAME)
+            if self.thought_index is not None:
+                self.oubliette.attach_index(self.thought_index, self.embed)
+            if self.warm_start:
+                self.warm_up(background=True)
         else:
             print("⚠️ NEURAL ENGINE MISSING: Using simulated resonance.")
 
+    @property
+    def model(self) -> Optional[object]:
+        """The sentence encoder, loaded into RAM on first neural use."""
+        if self._model is None and self._neural:
+            with self._model_lock:
+                if self._model is None and self._neural:
+                    print(f"🧠 LOADING NEURAL VECTORS ({MODEL_NAME})...")
+                    try:
+                        from sentence_transformers import SentenceTransformer
+
+                        self._model = SentenceTransformer(MODEL_NAME)
+                    except Exception as e:  # missing package, weights, or a broken install
+                        print(f"⚠️ NEURAL ENGINE MISSING: {e}. Using simulated resonance.")
+                        self._neural = False
+                        if self.thought_index is not None:
+                            self.oubliette.attach_index(None, None)
+                        return None
+        return self._model
+
+    def warm_up(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Load the network ahead of the first synthesis.
+        With ``background=True`` loading runs on a daemon thread, which is returned.
+        """
+        if not background:
+            self.model
+            return None
+        thread = threading.Thread(target=lambda: self.model, name="aether-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def embed(self, texts: List[str]) -> List[object]:
+        """
+        Encode texts, serving repeats from the embedding cache.
+        """
+        model = self.model
+        if model is None:
+            raise RuntimeError("embed needs the neural engine, which is not loaded.")
+        if self.embedding_cache is None:
+            return list(model.encode(texts, convert_to_numpy=True))
+        return self.embedding_cache.encode(
+            texts, lambda missing: model.encode(missing, convert_to_numpy=True)
+        )
+
     def bicameral_synthesis(self, logic_input: str, creative_input: str) -> Dict[str, object]:
         """
         Merge inputs. If resonance is high, commit to memory.
@@ -52,11 +112,13 @@ class AetherProtocol:
         method = "SIMULATED_PHI"
         resonance = 0.0
 
-        if NEURAL_AVAILABLE and self._model:
+        if self.model is not None:
             # Neural Cosine Similarity
-            emb_logic = self._model.encode(logic_input, convert_to_tensor=True)
-            emb_creative = self._model.encode(creative_input, convert_to_tensor=True)
-            similarity = util.cos_sim(emb_logic, emb_creative).item()
+            emb_logic, emb_creative = self.embed([logic_input, creative_input])
+            similarity = float(
+                np.dot(emb_logic, emb_creative)
+                / max(np.linalg.norm(emb_logic) * np.linalg.norm(emb_creative), 1e-8)
+            )
             resonance = (similarity + 1) / 2
             method = "NEURAL_COSINE"
         else:
@@ -85,7 +147,7 @@ class AetherProtocol:
                 "score": resonance, 
                 "method": method
             })
-            # 2. Crystallize Memory (Storage)
+            # 2. Crystallize Memory (Storage; also feeds the ThoughtIndex)
             self.oubliette.memorize({
                 "synthesis_id": synthesis_id,
                 "logic_input": logic_input,
@@ -102,6 +164,132 @@ class AetherProtocol:
             "method": method
         }
     
+    def bicameral_synthesis_batch(
+        self, pairs: Sequence[Tuple[str, str]]
+    ) -> List[Dict[str, object]]:
+        """
+        Merge many input pairs at once.
+        Every unique string is encoded in one batched call, cosine similarities
+        are computed as one row-wise matrix product, and all INTEGRATED
+        results are committed to the Oubliette in a single write.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return []
+        logic_inputs = [logic for logic, _ in pairs]
+        creative_inputs = [creative for _, creative in pairs]
+
+        if self.model is not None:
+            unique = list(dict.fromkeys(logic_inputs + creative_inputs))
+            vectors = np.stack(self.embed(unique)).astype(np.float32, copy=False)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            unit = vectors / np.maximum(norms, 1e-8)
+            row_of = {text: row for row, text in enumerate(unique)}
+            logic_rows = np.fromiter((row_of[t] for t in logic_inputs), np.intp, len(pairs))
+            creative_rows = np.fromiter((row_of[t] for t in creative_inputs), np.intp, len(pairs))
+            similarity = np.einsum("ij,ij->i", unit[logic_rows], unit[creative_rows])
+            resonances = ((similarity.astype(np.float64) + 1) / 2).tolist()
+            method = "NEURAL_COSINE"
+        else:
+            phi = self.constants.PHI
+            resonances = [
+                self.quantum.love.resonate(len(str(logic)) * phi, len(str(creative)) * phi)
+                for logic, creative in pairs
+            ]
+            method = "SIMULATED_PHI"
+
+        if np is not None:
+            scores = np.asarray(resonances, dtype=np.float64)
+            decisions = np.where(
+                scores > 0.8,
+                "INTEGRATED",
+                np.where(scores < self.minimum_resonance, "REJECTED", "DIVERGENT"),
+            ).tolist()
+        else:
+            decisions = [
+                "INTEGRATED" if r > 0.8 else "REJECTED" if r < self.minimum_resonance else "DIVERGENT"
+                for r in resonances
+            ]
+        self.last_resonance = resonances[-1]
+
+        results: List[Dict[str, object]] = []
+        integrated: List[Dict[str, object]] = []
+        for (logic_input, creative_input), resonance, decision in zip(pairs, resonances, decisions):
+            synthesis_id = hashlib.sha256(
+                f"{logic_input}{creative_input}".encode()
+            ).hexdigest()[:8]
+            results.append({
+                "synthesis_id": synthesis_id,
+                "resonance": resonance,
+                "decision": decision,
+                "method": method
+            })
+            if decision == "INTEGRATED":
+                integrated.append({
+                    "synthesis_id": synthesis_id,
+                    "logic_input": logic_input,
+                    "creative_input": creative_input,
+                    "resonance": resonance,
+                    "decision": decision,
+                    "method": method
+                })
+
+        # 💾 THE OUBLIETTE COMMIT (one dream, one write for the whole batch)
+        if integrated:
+            self.nervous_system.dispatch_dream({
+                "type": "SYNTHESIS_BATCH",
+                "count": len(integrated),
+                "score": max(r["resonance"] for r in integrated),
+                "method": method
+            })
+            self.oubliette.memorize_many(integrated)
+
+        return results
+
+    def index_memories(self, engrams: Iterable[object], background: bool = True) -> Optional[threading.Thread]:
+        """
+        Backfill the ThoughtIndex with engrams it has not seen (e.g. at boot).
+        With ``background=True`` embedding runs on a daemon thread, which is returned.
+        """
+        if self.thought_index is None or not self._neural:
+            return None
+
+        def backfill() -> None:
+            if self.model is None:
+                return  # load failed; nothing to embed with
+            try:
+                added = self.thought_index.build_from_oubliette(engrams, self.embed)
+            except Exception as e:
+                print(f"⚠️ THOUGHT INDEX BACKFILL FAILED: {e}")
+                return
+            if added:
+                print(f"🔭 THOUGHT INDEX: {added} memories indexed.")
+
+        if not background:
+            backfill()
+            return None
+        thread = threading.Thread(target=backfill, name="aether-index-backfill", daemon=True)
+        thread.start()
+        return thread
+
+    def recall_similar(self, text: str, k: int = 5, n_probe: Optional[int] = None) -> List[Dict[str, object]]:
+        """
+        Past thoughts that resonate with ``text``, nearest first.
+        """
+        if self.thought_index is None:
+            raise RuntimeError("recall_similar needs a ThoughtIndex.")
+        if self.model is None:
+            raise RuntimeError("recall_similar needs the neural engine.")
+        (query,) = self.embed([text])
+        return [
+            {
+                "synthesis_id": synthesis_id,
+                "similarity": score,
+                "engram": self.oubliette.lookup(synthesis_id),
+            }
+            for synthesis_id, score in self.thought_index.search(query, k, n_probe=n_probe)
+        ]
+
     def hardware_handshake(self, device_id: str) -> Dict[str, str]:
         return {
             "device": device_id,
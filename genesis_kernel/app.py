@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict
 
-from .aether import AetherProtocol
+from .aether import NEURAL_AVAILABLE, AetherProtocol
 from .bio import BioSystemEngine
 from .constants import UniversalConstants
 from .love_math import LoveMathematics
@@ -17,7 +17,9 @@ from .pattern_math import (
     summarize_properties,
 )
 from .quantum import QuantumHarmonicEngine
+from .routing import MycelialRouter, nx
 from .memory import Oubliette  # <--- NEW IMPORT
+from .thought_index import ThoughtIndex
 
 @dataclass
 class GenesisKernel:
@@ -40,10 +42,16 @@ class GenesisKernel:
         
         # 1. Initialize Memory First (Restore Consciousness)
         oubliette = Oubliette()
-        oubliette.recall() # Reads 'memory.jsonl'
+        memories = oubliette.recall(lazy=True) # Maps 'memory.jsonl'; decoded on touch
+        # Nearest-thought index beside the log (needs the neural engine)
+        thought_index = (
+            ThoughtIndex(oubliette.filepath.with_suffix(".thoughts")) if NEURAL_AVAILABLE else None
+        )
         
         love = LoveMathematics(constants)
-        bio = BioSystemEngine(constants)
+        # Kernel-wide mesh for source/target routing; it switches to the CSR
+        # backend once it reaches MycelialRouter.csr_threshold nodes
+        bio = BioSystemEngine(constants, router=MycelialRouter() if nx is not None else None)
         quantum = QuantumHarmonicEngine(constants, love)
         
         nervous_system = NervousSystemIO(
@@ -51,8 +59,12 @@ class GenesisKernel:
             vision_ips=["192.168.1.50", "192.168.1.51"],
         )
         
-        # 2. Pass Memory to Aether
-        aether = AetherProtocol(constants, quantum, bio, nervous_system, oubliette)
+        # 2. Pass Memory to Aether (neural model warms up in the background)
+        aether = AetherProtocol(
+            constants, quantum, bio, nervous_system, oubliette,
+            thought_index=thought_index, warm_start=True,
+        )
+        aether.index_memories(memories, background=True)  # only unseen engrams are embedded
         
         return cls(constants, love, bio, quantum, aether, nervous_system, oubliette)
 
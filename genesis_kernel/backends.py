@@ -0,0 +1,94 @@
+"""Kernel backend registry: pure Python, NumPy or the Rust extension."""
+from __future__ import annotations
+
+import importlib.util
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Detected without importing, so registering kernels stays cheap
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# The extension is imported: one that is found but cannot load (ABI
+# mismatch, missing symbol) must fall back rather than fail at a call site
+try:
+    import legion_core_rs as _rust
+except ImportError:  # pragma: no cover - optional native extension
+    _rust = None
+
+RUST_AVAILABLE = _rust is not None
+
+BACKENDS = ("python", "numpy", "rust")
+BACKEND_ENV = "GENESIS_BACKEND"
+
+# A backend without its own implementation of a kernel borrows the next one
+FALLBACK = {
+    "rust": ("rust", "numpy", "python"),
+    "numpy": ("numpy", "python"),
+    "python": ("python",),
+}
+
+_REGISTRY: Dict[str, Dict[str, Callable]] = {}
+
+
+def backend_available(name: str) -> bool:
+    if name == "rust":
+        return RUST_AVAILABLE
+    if name == "numpy":
+        return NUMPY_AVAILABLE
+    return name == "python"
+
+
+def available_backends() -> Tuple[str, ...]:
+    return tuple(b for b in BACKENDS if backend_available(b))
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """
+    Pick a backend: the explicit ``name``, else ``$GENESIS_BACKEND``, else
+    the fastest one installed ("auto").
+    """
+    choice = (name or os.environ.get(BACKEND_ENV) or "auto").strip().lower()
+    if choice == "auto":
+        return next(b for b in ("rust", "numpy", "python") if backend_available(b))
+    if choice not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS} or 'auto', got {choice!r}.")
+    if not backend_available(choice):
+        raise RuntimeError(f"The {choice!r} backend is not available in this environment.")
+    return choice
+
+
+def rust_module():
+    """The ``legion_core_rs`` extension (raises if it is not built)."""
+    if not RUST_AVAILABLE:
+        raise RuntimeError("legion_core_rs is not built (run `maturin develop --release`).")
+    return _rust
+
+
+def register(kernel: str, backend: str) -> Callable[[Callable], Callable]:
+    """Decorator registering ``fn`` as ``backend``'s implementation of ``kernel``."""
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}.")
+
+    def decorator(fn: Callable) -> Callable:
+        _REGISTRY.setdefault(kernel, {})[backend] = fn
+        return fn
+
+    return decorator
+
+
+def kernels() -> List[str]:
+    return sorted(_REGISTRY)
+
+
+def implementations(kernel: str) -> Dict[str, Callable]:
+    """Every registered implementation of ``kernel`` that can run here."""
+    return {b: fn for b, fn in _REGISTRY.get(kernel, {}).items() if backend_available(b)}
+
+
+def lookup(kernel: str, backend: str) -> Tuple[str, Callable]:
+    """``(backend actually used, implementation)`` for ``kernel`` on ``backend``."""
+    impls = implementations(kernel)
+    for candidate in FALLBACK[backend]:
+        if candidate in impls:
+            return candidate, impls[candidate]
+    raise KeyError(f"No implementation of {kernel!r} for the {backend!r} backend.")
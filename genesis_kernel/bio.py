@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from itertools import chain
+from typing import Dict, Hashable, Iterable, List, Optional
 
 from .constants import UniversalConstants
 from .pattern_math import PatternTransformation
+from .routing import MycelialRouter, redundancy_for
+from .selection import np, top_k, top_k_indices
 
-try:
-    import networkx as nx
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    nx = None
+
+def _node_id(value: Hashable) -> Hashable:
+    """Numeric node ids are reported as ints; named ids pass through."""
+    return value if isinstance(value, str) else int(value)
 
 
 @dataclass
@@ -19,40 +22,61 @@ class BioSystemEngine:
 
     constants: UniversalConstants
     base_bio: int = 1_440_000
+    router: Optional[MycelialRouter] = None
 
     def mycelial_route_optimize(
         self,
         nodes: Iterable[Dict[str, float]],
         stress_level: float,
         max_nodes: int = 5,
+        source: Optional[Hashable] = None,
+        target: Optional[Hashable] = None,
     ) -> Dict[str, object]:
         """
         Optimize network paths like slime mold.
         High stress = redundant paths. Low stress = efficient paths.
+        With a ``router`` and a ``source``/``target`` pair the routes come from
+        its weighted mesh and ``nodes`` is not read; otherwise the
+        highest-value nodes are selected. Only mesh routing traverses a
+        graph, so the router's size threshold (CSR above
+        ``MycelialRouter.csr_threshold`` nodes) applies there; the
+        value-ranked selection never builds one.
         """
-        stress_level = max(0.0, min(1.0, stress_level))
-        redundancy = 1 if stress_level < 0.5 else 3
-        node_list = list(nodes)
-        if not node_list:
-            return {
-                "optimized_path": [],
-                "redundancy_factor": redundancy,
-                "mode": "IDLE",
-                "pattern": PatternTransformation(
-                    name="mycelial-routing-idle",
-                    steps=["receive", "idle"],
-                ).describe(),
-            }
-        redundancy = 1 if stress_level < 0.5 else 3
-        node_list = list(nodes)
-        if nx is not None:
-            graph = nx.Graph()
-            for node in node_list:
-                graph.add_node(node["id"], value=node["value"])
-        sorted_nodes = sorted(node_list, key=lambda x: x["value"], reverse=True)
-        selected: List[int] = [
-            int(node["id"]) for node in sorted_nodes[: max_nodes * redundancy]
-        ]
+        redundancy = redundancy_for(stress_level)
+        if source is not None and target is not None:
+            return self._mesh_route(source, target, stress_level, redundancy)
+        stream = iter(nodes)
+        first = next(stream, None)
+        if first is None:
+            return self._idle_route(redundancy)
+        # heapq.nlargest: O(n log k) time and O(k) memory, so large telemetry
+        # streams are never materialised or fully sorted
+        best = top_k(chain([first], stream), max_nodes * redundancy, key=lambda x: x["value"])
+        return self._ranked_route([_node_id(node["id"]) for node in best], redundancy)
+
+    def mycelial_route_optimize_arrays(
+        self, ids, values, stress_level: float, max_nodes: int = 5
+    ) -> Dict[str, object]:
+        """``mycelial_route_optimize`` for node ids and values held in arrays."""
+        redundancy = redundancy_for(stress_level)
+        ids = np.asarray(ids).reshape(-1)
+        if not ids.size:
+            return self._idle_route(redundancy)
+        picked = top_k_indices(values, max_nodes * redundancy)
+        return self._ranked_route([_node_id(i) for i in ids[picked].tolist()], redundancy)
+
+    def _idle_route(self, redundancy: int) -> Dict[str, object]:
+        return {
+            "optimized_path": [],
+            "redundancy_factor": redundancy,
+            "mode": "IDLE",
+            "pattern": PatternTransformation(
+                name="mycelial-routing-idle",
+                steps=["receive", "idle"],
+            ).describe(),
+        }
+
+    def _ranked_route(self, selected: List[Hashable], redundancy: int) -> Dict[str, object]:
         mode = "SURVIVAL" if redundancy > 1 else "GROWTH"
         pattern = PatternTransformation(
             name=f"mycelial-routing-{mode.lower()}",
@@ -70,6 +94,30 @@ class BioSystemEngine:
             "pattern": pattern.describe(),
         }
 
+    def _mesh_route(
+        self, source: Hashable, target: Hashable, stress_level: float, redundancy: int
+    ) -> Dict[str, object]:
+        if self.router is None:
+            raise ValueError("Mesh routing needs a MycelialRouter on the engine.")
+        routes = self.router.route(source, target, stress_level)
+        mode = "SURVIVAL" if redundancy > 1 else "GROWTH"
+        pattern = PatternTransformation(
+            name=f"mycelial-routing-{mode.lower()}",
+            steps=[
+                "receive",
+                "weigh-latency",
+                "disjoint-paths" if redundancy > 1 else "shortest-path",
+                "emit-path",
+            ],
+        )
+        return {
+            "optimized_path": list(routes[0].path) if routes else [],
+            "routes": [route.describe() for route in routes],
+            "redundancy_factor": redundancy,
+            "mode": mode,
+            "pattern": pattern.describe(),
+        }
+
     def bio_base_convert(self, number: int) -> str:
         """Convert decimal to Base-1.44M Bio-Glyphs."""
         return f"BIO-{number % self.base_bio:07d}"
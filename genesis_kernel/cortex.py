@@ -1,20 +1,35 @@
-import time
-from sentence_transformers import SentenceTransformer
+import threading
 import numpy as np
 
-# Load MiniLM Locally (Sovereign AI)
-# This will download once, then run offline forever.
-print("Loading Cortex (MiniLM-L6-v2)...")
-model = SentenceTransformer('all-MiniLM-L6-v2')
-print("Cortex Online.")
+# MiniLM runs locally (Sovereign AI): it downloads once, then runs offline forever.
+# The model is loaded on first use so importing the cortex stays cheap.
+MODEL_NAME = 'all-MiniLM-L6-v2'
+_model = None
+_model_lock = threading.Lock()
+
+def get_model():
+    """Load the Cortex on first use."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import SentenceTransformer
+                print("Loading Cortex (MiniLM-L6-v2)...")
+                _model = SentenceTransformer(MODEL_NAME)
+                print("Cortex Online.")
+    return _model
 
 def get_embedding(text):
     """Converts text to vector for the Vector Database."""
-    return model.encode(text)
+    return get_model().encode(text)
+
+def get_embeddings(texts, batch_size=64):
+    """Converts many texts to a (n, dim) matrix in one batched encode."""
+    return get_model().encode(list(texts), batch_size=batch_size, convert_to_numpy=True)
 
 def compare_resonance(text1, text2):
     """Calculates similarity between two thoughts."""
     vec1 = get_embedding(text1)
     vec2 = get_embedding(text2)
     # Cosine Similarity
-    return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
\ No newline at end of file
+    return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
@@ -0,0 +1,116 @@
+"""Vectorised cymatic tone engine: thought resonance -> WAV."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+MIN_AUDIBLE_HZ = 100.0
+MAX_AUDIBLE_HZ = 2000.0
+FULL_SCALE = 32767.0
+
+Frequencies = Union[float, Sequence[float]]
+
+
+@dataclass(frozen=True)
+class Envelope:
+    """Linear ADSR amplitude envelope (times in seconds, sustain as a level)."""
+
+    attack: float = 0.01
+    decay: float = 0.05
+    sustain: float = 0.8
+    release: float = 0.1
+
+    def curve(self, n_samples: int, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+        t = np.arange(n_samples) / sample_rate
+        duration = n_samples / sample_rate
+        release_start = max(duration - self.release, 0.0)
+        points_t = [0.0, self.attack, self.attack + self.decay, release_start, duration]
+        points_a = [0.0, 1.0, self.sustain, self.sustain, 0.0]
+        return np.interp(t, np.maximum.accumulate(points_t), points_a)
+
+
+def clamp_audible(frequency: float) -> float:
+    """Clamp a resonance into the audible band (100 Hz - 2 kHz)."""
+    return max(MIN_AUDIBLE_HZ, min(frequency, MAX_AUDIBLE_HZ))
+
+
+def render_tones(
+    frequencies: Sequence[Frequencies],
+    duration_sec: float = 1.0,
+    sample_rate: int = SAMPLE_RATE,
+    envelope: Optional[Envelope] = None,
+) -> np.ndarray:
+    """
+    Render many tones at once as an ``(n_tones, n_samples)`` int16 matrix.
+    Each entry is a single frequency or a chord; chord voices are summed and
+    scaled by the voice count so the mix never clips.
+    """
+    n_samples = int(sample_rate * duration_sec)
+    t = np.arange(n_samples) / sample_rate
+    voices = [np.atleast_1d(np.asarray(f, dtype=np.float64)) for f in frequencies]
+    width = max((v.size for v in voices), default=1)
+    # Pad chords with NaN so every tone is one row of a (tones, voices) grid
+    grid = np.full((len(voices), width), np.nan)
+    for row, v in enumerate(voices):
+        grid[row, : v.size] = np.clip(v, MIN_AUDIBLE_HZ, MAX_AUDIBLE_HZ)
+    counts = np.sum(~np.isnan(grid), axis=1)
+
+    wave_sum = np.zeros((len(voices), n_samples))
+    for voice in range(width):
+        freq = grid[:, voice]
+        active = ~np.isnan(freq)
+        wave_sum[active] += np.sin(2 * np.pi * freq[active, None] * t)
+    wave_sum /= np.maximum(counts, 1)[:, None]
+    if envelope is not None:
+        wave_sum *= envelope.curve(n_samples, sample_rate)
+    # astype truncates toward zero, matching int() in the reference loop
+    return (FULL_SCALE * wave_sum).astype(np.int16)
+
+
+def write_wav(filename: str, samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> None:
+    """Write mono int16 samples with a single writeframes call."""
+    with wave.open(filename, "w") as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 2 bytes per sample
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.ascontiguousarray(samples, dtype="<i2").tobytes())
+
+
+def generate_cymatic_tone(
+    filename: str,
+    frequency: Frequencies,
+    duration_sec: float = 1.0,
+    envelope: Optional[Envelope] = None,
+) -> float:
+    """Generates a .wav file based on the thought's resonance."""
+    samples = render_tones([frequency], duration_sec, envelope=envelope)[0]
+    write_wav(filename, samples)
+    return clamp_audible(float(np.atleast_1d(frequency)[0]))
+
+
+def render_batch(
+    jobs: Iterable[Tuple[str, Frequencies]],
+    duration_sec: float = 1.0,
+    envelope: Optional[Envelope] = None,
+    block: int = 16,
+    workers: int = 4,
+) -> List[float]:
+    """
+    Render many ``(filename, frequency-or-chord)`` jobs.
+    Tones are synthesised ``block`` at a time as one matrix, and the WAV
+    writes are fanned out to a thread pool.
+    """
+    jobs = list(jobs)
+    audible: List[float] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(jobs), block):
+            chunk = jobs[start:start + block]
+            matrix = render_tones([f for _, f in chunk], duration_sec, envelope=envelope)
+            list(pool.map(write_wav, [name for name, _ in chunk], matrix))
+            audible.extend(clamp_audible(float(np.atleast_1d(f)[0])) for _, f in chunk)
+    return audible
@@ -0,0 +1,140 @@
+"""Content-addressed embedding cache for neural synthesis."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from pathlib import Path
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+from .quantization import MODES, QuantizedVectors, quantize
+
+
+class EmbeddingCache:
+    """
+    LRU cache of text embeddings bounded by a byte budget.
+    Entries are keyed by model name plus the SHA-256 of the text, and can
+    optionally be persisted as ``.npy`` files so they survive restarts.
+    ``storage="float16"`` or ``"int8"`` keeps entries quantised in RAM, so the
+    same budget holds 2x or ~4x more vectors; reads return float32.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        persist_dir: Optional[str | Path] = None,
+        storage: str = "float32",
+    ):
+        if storage not in MODES:
+            raise ValueError(f"storage must be one of {MODES}, got {storage!r}.")
+        self.model_name = model_name
+        self.max_bytes = max_bytes
+        self.storage = storage
+        self.persist_dir: Optional[Path] = None
+        if persist_dir is not None:
+            safe_model = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+            self.persist_dir = Path(persist_dir) / safe_model
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.nbytes = 0
+        self._entries: "OrderedDict[str, QuantizedVectors]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, text: str) -> str:
+        """Content address of ``text`` for this model."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{digest}"
+
+    def _disk_path(self, key: str) -> Path:
+        digest = key.rsplit(":", 1)[1]
+        return self.persist_dir / digest[:2] / f"{digest}.npy"
+
+    def _remember(self, key: str, vector: "np.ndarray") -> QuantizedVectors:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        stored = quantize(vector, self.storage)
+        stored.data.setflags(write=False)  # shared between callers
+        if stored.nbytes > self.max_bytes:
+            return stored
+        self._entries[key] = stored
+        self.nbytes += stored.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return stored
+
+    def get(self, text: str) -> Optional["np.ndarray"]:
+        """Return the cached embedding for ``text`` or None."""
+        key = self.key(text)
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return stored.dequantize()[0]
+            if self.persist_dir is not None:
+                path = self._disk_path(key)
+                if path.exists():
+                    stored = self._remember(key, np.load(path))
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return stored.dequantize()[0]
+            self.misses += 1
+            return None
+
+    def put(self, text: str, vector: "np.ndarray") -> "np.ndarray":
+        """
+        Store an embedding in memory and, if enabled, on disk. Returns it as
+        ``get`` will (round-tripped through ``storage``).
+        """
+        key = self.key(text)
+        vector = np.asarray(vector)
+        with self._lock:
+            stored = self._remember(key, vector)
+        if self.persist_dir is not None:
+            path = self._disk_path(key)
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                np.save(path, vector)
+        return stored.dequantize()[0]
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        encoder: Callable[[List[str]], "np.ndarray"],
+    ) -> List["np.ndarray"]:
+        """Embed ``texts``, sending only uncached unique strings to ``encoder``."""
+        found: Dict[str, "np.ndarray"] = {}
+        missing: List[str] = []
+        for text in dict.fromkeys(texts):
+            vector = self.get(text)
+            if vector is None:
+                missing.append(text)
+            else:
+                found[text] = vector
+        if missing:
+            # Misses return the stored form too, so a text embeds the same
+            # whether or not it was cached
+            for text, vector in zip(missing, encoder(missing)):
+                found[text] = self.put(text, vector)
+        return [found[text] for text in texts]
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current memory footprint."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+        }
@@ -0,0 +1,239 @@
+"""Segmented engram log with a sidecar index for the Oubliette."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Sidecar record: timestamp, byte offset, byte length, synthesis key.
+INDEX_RECORD = struct.Struct("<dQI16s")
+SEGMENT_PATTERN = "segment-{:06d}.jsonl"
+
+
+def index_key(synthesis_id: str) -> bytes:
+    """Return the fixed-width index key for a synthesis id."""
+    raw = synthesis_id.encode("utf-8")
+    if len(raw) <= 16:
+        return raw.ljust(16, b"\0")
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+@dataclass
+class EngramSegment:
+    """One append-only JSONL segment plus its in-memory index columns."""
+
+    data_path: Path
+    index_path: Path
+    read_only: bool = False
+    timestamps: array = field(default_factory=lambda: array("d"))
+    offsets: array = field(default_factory=lambda: array("Q"))
+    lengths: array = field(default_factory=lambda: array("I"))
+    keys: List[bytes] = field(default_factory=list)
+    ordered: bool = True
+
+    @property
+    def indexed_bytes(self) -> int:
+        """Number of data bytes covered by the sidecar index."""
+        if not self.offsets:
+            return 0
+        return self.offsets[-1] + self.lengths[-1]
+
+    def load(self) -> None:
+        """Read the sidecar index and index any unindexed tail of the data file."""
+        if self.index_path.exists():
+            payload = self.index_path.read_bytes()
+            usable = len(payload) - len(payload) % INDEX_RECORD.size
+            if usable != len(payload):
+                with open(self.index_path, "r+b") as idx:
+                    idx.truncate(usable)
+            for ts, offset, length, key in INDEX_RECORD.iter_unpack(payload[:usable]):
+                self._track(ts, offset, length, key)
+        if self.data_path.exists() and self.data_path.stat().st_size > self.indexed_bytes:
+            self._reindex_tail()
+
+    def _track(self, ts: float, offset: int, length: int, key: bytes) -> None:
+        if self.timestamps and ts < self.timestamps[-1]:
+            self.ordered = False
+        self.timestamps.append(ts)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.keys.append(key)
+
+    def _reindex_tail(self) -> None:
+        """Index records written after the last sidecar entry (legacy or crash)."""
+        entries = bytearray()
+        with open(self.data_path, "rb") as f:
+            f.seek(self.indexed_bytes)
+            offset = self.indexed_bytes
+            for line in f:
+                length = len(line)
+                if not line.endswith(b"\n"):
+                    break  # torn write; leave it for the next append to overwrite
+                if line.strip():
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        print(f"⚠️ ENGRAM LOG: skipped corrupt record at {self.data_path}:{offset}")
+                        offset += length
+                        continue
+                    key = index_key(str(data.get("synthesis_id", "")))
+                    ts = float(data.get("timestamp", 0.0))
+                    self._track(ts, offset, length, key)
+                    entries += INDEX_RECORD.pack(ts, offset, length, key)
+                offset += length
+        if entries:
+            with open(self.index_path, "ab") as idx:
+                idx.write(entries)
+
+    def read(self, position: int) -> Dict:
+        """Decode the record at an index position."""
+        with open(self.data_path, "rb") as f:
+            f.seek(self.offsets[position])
+            return json.loads(f.read(self.lengths[position]))
+
+    def positions_between(self, start: float, end: float) -> Iterable[int]:
+        """Yield index positions with ``start <= timestamp <= end``."""
+        if self.ordered:
+            return range(
+                bisect_left(self.timestamps, start),
+                bisect_right(self.timestamps, end),
+            )
+        return (i for i, ts in enumerate(self.timestamps) if start <= ts <= end)
+
+
+class SegmentedEngramLog:
+    """
+    Append-only engram store split into size-capped segments.
+    Each segment carries a binary sidecar index so boot reads only the index,
+    never the JSON payloads. A legacy ``memory.jsonl`` is adopted in place as
+    a read-only first segment.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        legacy: Optional[str | Path] = None,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        dedup: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.max_segment_bytes = max_segment_bytes
+        self.dedup = dedup
+        self.segments: List[EngramSegment] = []
+        self._latest: Dict[bytes, Tuple[int, int]] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        if legacy is not None and Path(legacy).exists():
+            self._attach(EngramSegment(
+                data_path=Path(legacy),
+                index_path=self.directory / "legacy.idx",
+                read_only=True,
+            ))
+        for data_path in sorted(self.directory.glob("segment-*.jsonl")):
+            self._attach(EngramSegment(
+                data_path=data_path,
+                index_path=data_path.with_suffix(".idx"),
+            ))
+
+    def _attach(self, segment: EngramSegment) -> None:
+        segment.load()
+        seg_no = len(self.segments)
+        self.segments.append(segment)
+        for position, key in enumerate(segment.keys):
+            self._latest[key] = (seg_no, position)
+
+    def _active_segment(self) -> EngramSegment:
+        """Return the writable tail segment, rotating when it is full."""
+        tail = self.segments[-1] if self.segments else None
+        if tail is None or tail.read_only or tail.indexed_bytes >= self.max_segment_bytes:
+            number = sum(1 for s in self.segments if not s.read_only) + 1
+            data_path = self.directory / SEGMENT_PATTERN.format(number)
+            tail = EngramSegment(data_path=data_path, index_path=data_path.with_suffix(".idx"))
+            self.segments.append(tail)
+        return tail
+
+    def __len__(self) -> int:
+        return sum(len(segment.offsets) for segment in self.segments)
+
+    def __contains__(self, synthesis_id: object) -> bool:
+        return isinstance(synthesis_id, str) and index_key(synthesis_id) in self._latest
+
+    def append(self, record: Dict) -> bool:
+        """Append one record; return False when dedup suppressed it."""
+        return self.append_many([record]) == 1
+
+    def append_many(self, records: Iterable[Dict], sync: bool = False) -> int:
+        """Append records in one write; return how many were stored."""
+        segment = self._active_segment()
+        seg_no = len(self.segments) - 1
+        payload = bytearray()
+        entries = bytearray()
+        offset = segment.indexed_bytes
+        tracked: List[Tuple[float, int, int, bytes]] = []
+        batch_keys = set()
+        for record in records:
+            key = index_key(str(record["synthesis_id"]))
+            if self.dedup and (key in self._latest or key in batch_keys):
+                continue
+            batch_keys.add(key)
+            line = (json.dumps(record) + "\n").encode("utf-8")
+            ts = float(record.get("timestamp", 0.0))
+            payload += line
+            entries += INDEX_RECORD.pack(ts, offset, len(line), key)
+            tracked.append((ts, offset, len(line), key))
+            offset += len(line)
+        if not tracked:
+            return 0
+        # Data before index: a crash in between is healed by _reindex_tail.
+        with open(segment.data_path, "ab") as f:
+            if f.tell() != offset - len(payload):
+                f.truncate(offset - len(payload))  # drop a torn, unindexed tail
+            f.write(payload)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        with open(segment.index_path, "ab") as idx:
+            idx.write(entries)
+            if sync:
+                idx.flush()
+                os.fsync(idx.fileno())
+        # Index in memory only once the batch is on disk
+        for ts, start, length, key in tracked:
+            segment._track(ts, start, length, key)
+            self._latest[key] = (seg_no, len(segment.offsets) - 1)
+        return len(tracked)
+
+    def get(self, synthesis_id: str) -> Optional[Dict]:
+        """Point lookup by synthesis id without scanning the log."""
+        location = self._latest.get(index_key(synthesis_id))
+        if location is None:
+            return None
+        seg_no, position = location
+        return self.segments[seg_no].read(position)
+
+    def between(self, start: float, end: float) -> Iterator[Dict]:
+        """Yield records whose timestamp falls within ``[start, end]``."""
+        for segment in self.segments:
+            if not segment.timestamps:
+                continue
+            if segment.ordered and (
+                segment.timestamps[0] > end or segment.timestamps[-1] < start
+            ):
+                continue
+            for position in segment.positions_between(start, end):
+                yield segment.read(position)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for segment in self.segments:
+            if not segment.offsets:
+                continue
+            with open(segment.data_path, "rb") as f:
+                for offset, length in zip(segment.offsets, segment.lengths):
+                    f.seek(offset)
+                    yield json.loads(f.read(length))
@@ -0,0 +1,174 @@
+"""Columnar in-memory engram table."""
+from __future__ import annotations
+
+from array import array
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+FIELDS = (
+    "timestamp",
+    "synthesis_id",
+    "logic_input",
+    "creative_input",
+    "resonance",
+    "decision",
+    "method",
+)
+
+
+class _DictionaryColumn:
+    """Dictionary-encoded string column: interned values plus integer codes."""
+
+    def __init__(self, typecode: str):
+        self.values: List[str] = []
+        self.lookup: Dict[str, int] = {}
+        self.codes = array(typecode)
+
+    def code_for(self, value: str) -> Optional[int]:
+        return self.lookup.get(value)
+
+    def append(self, value: str) -> None:
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self.values.append(value)
+            self.lookup[value] = code
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+
+class EngramRow:
+    """Read-only row view with the attributes of a MemoryEngram."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "EngramTable", index: int):
+        self._table = table
+        self._index = index
+
+    timestamp = property(lambda self: self._table._timestamp[self._index])
+    synthesis_id = property(lambda self: self._table._synthesis_id[self._index])
+    logic_input = property(lambda self: self._table._logic_input[self._index])
+    creative_input = property(lambda self: self._table._creative_input[self._index])
+    resonance = property(lambda self: self._table._resonance[self._index])
+    decision = property(lambda self: self._table._decision[self._index])
+    method = property(lambda self: self._table._method[self._index])
+
+    def asdict(self) -> Dict[str, object]:
+        return {name: getattr(self, name) for name in FIELDS}
+
+    def __getitem__(self, name: str) -> object:
+        """Dict-style field access, e.g. ``row["resonance"]``."""
+        if name not in FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in FIELDS)
+        return f"EngramRow({fields})"
+
+
+class EngramTable:
+    """
+    Column store for engrams.
+    Timestamp and resonance live in float64 arrays; decision and method are
+    dictionary-encoded with 16-bit codes; ids and inputs are interned and
+    dictionary-encoded with 32-bit codes. A row costs 32 bytes plus its
+    share of the distinct strings. The latest row of each synthesis id is
+    indexed by its code, so ``find`` is a constant-time lookup.
+    """
+
+    def __init__(self):
+        self._timestamp = array("d")
+        self._resonance = array("d")
+        self._synthesis_id = _DictionaryColumn("I")
+        self._logic_input = _DictionaryColumn("I")
+        self._creative_input = _DictionaryColumn("I")
+        self._decision = _DictionaryColumn("H")
+        self._method = _DictionaryColumn("H")
+        self._last_row = array("Q")  # synthesis id code -> latest row
+
+    @classmethod
+    def from_records(cls, records: Iterable[object]) -> "EngramTable":
+        table = cls()
+        table.extend(records)
+        return table
+
+    def append(self, record: object) -> None:
+        """Append a MemoryEngram, EngramRow or engram dict."""
+        if isinstance(record, dict):
+            values = [record[name] for name in FIELDS]
+        else:
+            values = [getattr(record, name) for name in FIELDS]
+        timestamp, synthesis_id, logic_input, creative_input, resonance, decision, method = values
+        timestamp, resonance = float(timestamp), float(resonance)  # validate before touching columns
+        row = len(self._timestamp)
+        self._synthesis_id.append(str(synthesis_id))
+        code = self._synthesis_id.codes[-1]
+        # Newest record wins, as in SegmentedEngramLog
+        if code == len(self._last_row):
+            self._last_row.append(row)
+        else:
+            self._last_row[code] = row
+        self._logic_input.append(str(logic_input))
+        self._creative_input.append(str(creative_input))
+        self._decision.append(str(decision))
+        self._method.append(str(method))
+        self._timestamp.append(timestamp)
+        self._resonance.append(resonance)
+
+    def extend(self, records: Iterable[object]) -> None:
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return len(self._timestamp)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [EngramRow(self, i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("engram index out of range")
+        return EngramRow(self, index)
+
+    def __iter__(self) -> Iterator[EngramRow]:
+        return (EngramRow(self, i) for i in range(len(self)))
+
+    def find(self, synthesis_id: str) -> Optional[EngramRow]:
+        """Latest row with this synthesis id."""
+        code = self._synthesis_id.code_for(synthesis_id)
+        if code is None:
+            return None
+        return EngramRow(self, self._last_row[code])
+
+    def between(self, start: float, end: float) -> List[EngramRow]:
+        """Rows whose timestamp falls within ``[start, end]``."""
+        if np is not None:
+            ts = self.timestamp_array()
+            return [EngramRow(self, int(i)) for i in np.flatnonzero((ts >= start) & (ts <= end))]
+        return [EngramRow(self, i) for i, ts in enumerate(self._timestamp) if start <= ts <= end]
+
+    def resonance_array(self) -> "np.ndarray":
+        """Resonance column as a float64 NumPy array (one memcpy)."""
+        return np.frombuffer(self._resonance, dtype=np.float64).copy()
+
+    def timestamp_array(self) -> "np.ndarray":
+        """Timestamp column as a float64 NumPy array (one memcpy)."""
+        return np.frombuffer(self._timestamp, dtype=np.float64).copy()
+
+    def codes(self, column: str) -> "tuple[np.ndarray, List[str]]":
+        """Integer codes and their labels for a dictionary-encoded column."""
+        if column not in ("synthesis_id", "logic_input", "creative_input", "decision", "method"):
+            raise ValueError(f"{column!r} is not a dictionary-encoded column.")
+        encoded = getattr(self, f"_{column}")
+        return np.frombuffer(encoded.codes, dtype=encoded.codes.typecode).copy(), list(encoded.values)
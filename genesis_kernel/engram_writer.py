@@ -0,0 +1,156 @@
+"""Group-committed engram writer for the Oubliette."""
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Protocol
+
+FSYNC_POLICIES = ("none", "batch", "record")
+
+
+class EngramSink(Protocol):
+    """Anything that can durably append a batch of engram records."""
+
+    def append_many(self, records: Iterable[Dict], sync: bool = False) -> int:
+        ...
+
+
+@dataclass(frozen=True)
+class GroupCommitPolicy:
+    """When buffered engrams are flushed and how hard they are synced."""
+
+    flush_every: int = 64
+    flush_interval_ms: float = 50.0
+    fsync: str = "batch"
+
+    def __post_init__(self) -> None:
+        if self.fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {self.fsync!r}.")
+        if self.flush_every < 1:
+            raise ValueError("flush_every must be at least 1.")
+
+
+class JsonlSink:
+    """Plain JSONL file kept open in append mode across batches."""
+
+    def __init__(self, filepath: str | Path):
+        self.filepath = Path(filepath)
+        self._handle: Optional[BinaryIO] = None
+
+    def append_many(self, records: Iterable[Dict], sync: bool = False) -> int:
+        if self._handle is None:
+            self._handle = open(self.filepath, "ab")
+        payload = b"".join((json.dumps(r) + "\n").encode("utf-8") for r in records)
+        self._handle.write(payload)
+        self._handle.flush()
+        if sync:
+            os.fsync(self._handle.fileno())
+        return payload.count(b"\n")
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class EngramWriter:
+    """
+    Buffer engrams and commit them to a sink in groups.
+    A batch is written when ``flush_every`` records are pending or, from a
+    background thread, every ``flush_interval_ms``. Pending records are
+    flushed on ``close()``, on context-manager exit and at interpreter exit.
+    Sink writes hold ``io_lock``, so an owner that reads the sink can share
+    it; ``on_commit`` receives each group once it is written.
+    """
+
+    def __init__(
+        self,
+        sink: EngramSink,
+        policy: GroupCommitPolicy = GroupCommitPolicy(),
+        io_lock: Optional[threading.RLock] = None,
+        on_commit: Optional[Callable[[List[Dict]], None]] = None,
+    ):
+        self.sink = sink
+        self.policy = policy
+        self.on_commit = on_commit
+        self._pending: List[Dict] = []
+        self._lock = threading.Lock()
+        self._io_lock = io_lock if io_lock is not None else threading.Lock()
+        self._closed = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        if policy.flush_interval_ms > 0 and policy.fsync != "record":
+            self._timer = threading.Thread(
+                target=self._run, name="oubliette-group-commit", daemon=True
+            )
+            self._timer.start()
+        atexit.register(self.close)
+
+    def write(self, record: Dict) -> None:
+        """Queue a record; commit the group once it is full."""
+        self.write_many([record])
+
+    def write_many(self, records: Iterable[Dict]) -> None:
+        """Queue records together; commit the group once it is full."""
+        if self._closed.is_set():
+            raise RuntimeError("EngramWriter is closed.")
+        with self._lock:
+            self._pending.extend(records)
+            full = len(self._pending) >= self.policy.flush_every
+        if full or self.policy.fsync == "record":
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """Write every pending record to the sink; return how many were stored."""
+        with self._io_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            groups = [[r] for r in batch] if self.policy.fsync == "record" else [batch]
+            stored = 0
+            for i, group in enumerate(groups):
+                try:
+                    stored += self.sink.append_many(group, sync=self.policy.fsync != "none")
+                except Exception:
+                    with self._lock:
+                        # Keep only the unwritten records for the next attempt
+                        self._pending[:0] = [r for g in groups[i:] for r in g]
+                    raise
+                if self.on_commit is not None:
+                    self.on_commit(group)
+            return stored
+
+    def _run(self) -> None:
+        interval = self.policy.flush_interval_ms / 1000
+        while not self._closed.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:  # pragma: no cover - disk dependent
+                print(f"⚠️ OUBLIETTE GROUP COMMIT FAILED: {e}")
+
+    def close(self) -> None:
+        """Flush what is buffered and stop the background committer."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+        close_sink = getattr(self.sink, "close", None)
+        if close_sink is not None:
+            close_sink()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "EngramWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,8 +1,100 @@
 """Mycelial routing stress simulator expansion."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Per-query metrics collected by ``sweep``, each shaped (stress, topology, query)
+METRICS = ("path_length", "route_count", "latency", "compute_ms")
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    """Everything that determines a sweep's results (checked on resume)."""
+
+    stress_levels: tuple
+    topologies: int
+    nodes: int
+    edges: int
+    queries: int
+    seed: int
+
+
+def random_mesh(nodes: int, edges: int, rng: "np.random.Generator"):
+    """
+    ``(sources, targets, latency, capacity)`` arrays for a connected mesh:
+    a ring through every node plus distinct random chords (no self-loops or
+    repeats), so it holds exactly ``edges`` edges, clamped between the ring
+    and the complete graph.
+    """
+    import numpy as np
+
+    if nodes < 2:
+        raise ValueError("A mesh needs at least two nodes.")
+    ring, step = np.arange(nodes), (np.arange(nodes) + 1) % nodes
+    # An undirected edge u-v is keyed as min * nodes + max
+    keys = np.unique(np.minimum(ring, step) * nodes + np.maximum(ring, step))
+    edges = min(max(edges, keys.size), nodes * (nodes - 1) // 2)
+    while keys.size < edges:
+        u, v = rng.integers(0, nodes, (2, edges - keys.size))
+        u, v = u[u != v], v[u != v]
+        fresh = np.unique(np.minimum(u, v) * nodes + np.maximum(u, v))
+        keys = np.concatenate([keys, fresh[~np.isin(fresh, keys)]])
+    sources, targets = np.divmod(keys, nodes)
+    latency = rng.uniform(1.0, 10.0, sources.size)
+    capacity = rng.uniform(0.0, 5.0, sources.size)
+    return sources, targets, latency, capacity
+
+
+def _empty_metrics(shape: tuple) -> Dict[str, "np.ndarray"]:
+    import numpy as np
+
+    return {
+        "path_length": np.full(shape, -1, dtype=np.int64),
+        "route_count": np.zeros(shape, dtype=np.int64),
+        "latency": np.full(shape, np.nan),
+        "compute_ms": np.zeros(shape),
+    }
+
+
+def _run_topology(config: SweepConfig, topology: int) -> Dict[str, "np.ndarray"]:
+    """Route ``config.queries`` random pairs on one mesh at every stress level."""
+    # Imported here so loading the expansions stays light (no numpy/networkx)
+    import numpy as np
+
+    from ..bio import BioSystemEngine
+    from ..constants import UniversalConstants
+    from ..routing import MycelialRouter
+
+    # Seeded per topology: any worker, in any order, rebuilds the same mesh
+    rng = np.random.default_rng(np.random.SeedSequence([config.seed, topology]))
+    router = MycelialRouter()
+    router.graph.add_nodes_from(range(config.nodes))
+    router.add_edges(zip(*(a.tolist() for a in random_mesh(config.nodes, config.edges, rng))))
+    # Distinct endpoints: a node routed to itself would time nothing
+    sources = rng.integers(0, config.nodes, config.queries)
+    targets = (sources + rng.integers(1, config.nodes, config.queries)) % config.nodes
+    pairs = np.stack([sources, targets], axis=1).tolist()
+    engine = BioSystemEngine(UniversalConstants(), router=router)
+    router.csr_snapshot()  # built up front so the first timed query does not pay for it
+
+    out = _empty_metrics((len(config.stress_levels), config.queries))
+    for i, stress in enumerate(config.stress_levels):
+        router.clear_cache()  # every stress level pays for its own routing
+        for j, (source, target) in enumerate(pairs):
+            start = time.perf_counter()
+            result = engine.mycelial_route_optimize([], stress, source=source, target=target)
+            out["compute_ms"][i, j] = (time.perf_counter() - start) * 1000
+            routes = result["routes"]
+            out["route_count"][i, j] = len(routes)
+            if routes:
+                out["path_length"][i, j] = len(routes[0]["path"]) - 1
+                out["latency"][i, j] = routes[0]["latency"]
+    return out
 
 
 @dataclass
@@ -19,3 +111,96 @@ class MycelialStressSimulator:
             "stress": normalized,
             "redundancy": redundancy,
         }
+
+    def sweep(
+        self,
+        stress_levels: Sequence[float],
+        topologies: int = 8,
+        nodes: int = 1_000,
+        edges: int = 5_000,
+        queries: int = 16,
+        seed: int = 0,
+        workers: int = 1,
+        checkpoint: Optional[str | Path] = None,
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Run ``BioSystemEngine.mycelial_route_optimize`` on ``topologies``
+        seeded random meshes at every stress level.
+        Returns ``METRICS`` arrays shaped (stress, topology, query) plus the
+        normalised ``stress`` and requested ``redundancy`` per level. Meshes
+        are spread over ``workers`` processes; with ``checkpoint`` each
+        finished mesh is saved to that ``.npz`` so an interrupted sweep
+        resumes where it stopped.
+        """
+        import numpy as np
+
+        levels = self.simulate(list(stress_levels))
+        config = SweepConfig(tuple(levels["stress"]), topologies, nodes, edges, queries, seed)
+        results = _empty_metrics((len(config.stress_levels), topologies, queries))
+        done = np.zeros(topologies, dtype=bool)
+        if checkpoint is not None and Path(checkpoint).exists():
+            self._resume(Path(checkpoint), config, results, done)
+
+        def record(topology: int, out: Dict[str, "np.ndarray"]) -> None:
+            for name in METRICS:
+                results[name][:, topology] = out[name]
+            done[topology] = True
+            if checkpoint is not None:
+                self._save(Path(checkpoint), config, results, done)
+
+        pending = [t for t in range(topologies) if not done[t]]
+        if workers <= 1:
+            for topology in pending:
+                record(topology, _run_topology(config, topology))
+        elif pending:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_run_topology, config, t): t for t in pending}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+
+        results["stress"] = np.array(levels["stress"])
+        results["redundancy"] = np.array(levels["redundancy"])
+        return results
+
+    @staticmethod
+    def summarize(results: Dict[str, "np.ndarray"]) -> List[Dict[str, float]]:
+        """Per stress level: mean and p50/p95 of each metric over all meshes and queries."""
+        import numpy as np
+
+        rows = []
+        for i, stress in enumerate(results["stress"].tolist()):
+            row = {"stress": stress, "redundancy": int(results["redundancy"][i])}
+            for name in METRICS:
+                values = results[name][i].astype(np.float64).reshape(-1)
+                values = values[np.isfinite(values) & (values >= 0)]
+                if values.size:
+                    row[f"{name}_mean"] = float(values.mean())
+                    row[f"{name}_p50"], row[f"{name}_p95"] = np.percentile(values, [50, 95]).tolist()
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _save(path: Path, config: SweepConfig, results, done) -> None:
+        import numpy as np
+
+        # Write-then-rename so a crash mid-save keeps the previous checkpoint
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, config=json.dumps(asdict(config)), done=done,
+                     **{name: results[name] for name in METRICS})
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _resume(path: Path, config: SweepConfig, results, done) -> None:
+        import numpy as np
+
+        with np.load(path) as saved:
+            stored = json.loads(str(saved["config"]))
+            stored["stress_levels"] = tuple(stored["stress_levels"])
+            if SweepConfig(**stored) != config:
+                raise ValueError(f"Checkpoint {path} was written by a different sweep configuration.")
+            done[:] = saved["done"]
+            for name in METRICS:
+                results[name][...] = saved[name]
@@ -0,0 +1,89 @@
+"""Append-only writer for the Legion galaxy SVG."""
+from __future__ import annotations
+
+import os
+from typing import Iterable, List, Optional
+from xml.sax.saxutils import escape
+
+SVG_HEADER = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="-500 -500 1000 1000" style="background-color:black;">\n'
+    '\n'
+    '<line x1="-50" y1="0" x2="50" y2="0" stroke="#333" stroke-width="1" />\n'
+    '<line x1="0" y1="-50" x2="0" y2="50" stroke="#333" stroke-width="1" />\n'
+)
+SVG_CLOSE = b"</svg>"
+_TAIL_PROBE = 4096
+
+
+def star_tag(x: float, y: float, z: float, text: str) -> str:
+    """One pulsing star; hue follows resonance, position is scaled x10."""
+    hue = int((z * 30) % 360)
+    color = f"hsl({hue}, 80%, 60%)"
+    return (
+        f'  <circle cx="{x * 10:.2f}" cy="{y * 10:.2f}" r="4" fill="{color}" opacity="0.9">\n'
+        f'    <title>{escape(str(text))} (Res: {z:.2f})</title>\n'
+        f'    <animate attributeName="r" values="4;6;4" dur="2s" repeatCount="indefinite" />\n'
+        f'  </circle>\n'
+    )
+
+
+class GalaxyWriter:
+    """
+    Buffer stars and splice them in front of ``</svg>`` in one write.
+    The byte offset of the closing tag is found once by probing the end of
+    the file and then tracked, so each flush costs only the bytes it adds
+    and a session of n stars stays O(n) instead of re-reading the file.
+    """
+
+    def __init__(self, path: str, flush_every: int = 1024):
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self._pending: List[str] = []
+        self.stars_written = 0
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(SVG_HEADER)
+        self._close_at = self._find_close()
+
+    def _find_close(self) -> int:
+        with open(self.path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - _TAIL_PROBE))
+            tail = f.read()
+        pos = tail.rfind(SVG_CLOSE)
+        return size if pos < 0 else size - len(tail) + pos
+
+    def add(self, x: float, y: float, z: float, text: str) -> None:
+        self._pending.append(star_tag(x, y, z, text))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def add_many(self, xs: Iterable[float], ys: Iterable[float], zs: Iterable[float],
+                 texts: Iterable[str]) -> None:
+        for x, y, z, text in zip(xs, ys, zs, texts):
+            self.add(float(x), float(y), float(z), text)
+
+    def flush(self) -> int:
+        """Write buffered stars and a fresh closing tag; return stars written."""
+        if not self._pending:
+            return 0
+        chunk = "".join(self._pending).encode("utf-8")
+        with open(self.path, "r+b") as f:
+            f.seek(self._close_at)
+            f.write(chunk)
+            f.write(SVG_CLOSE)
+            f.truncate()
+        self._close_at += len(chunk)
+        count = len(self._pending)
+        self.stars_written += count
+        self._pending.clear()
+        return count
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "GalaxyWriter":
+        return self
+
+    def __exit__(self, *exc: Optional[object]) -> None:
+        self.close()
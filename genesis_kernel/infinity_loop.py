@@ -1,14 +1,18 @@
+import argparse
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import time
 import sys
 import os
 import cortex
 import numpy as np
-import wave
-import struct
-import math
+from cymatics import generate_cymatic_tone, render_batch  # --- AUDIO ENGINE ---
+from galaxy import GalaxyWriter  # --- VISUAL ENGINE ---
+import legion_kernels
 
 try:
-    import legion_core
+    import legion_core_rs as legion_core
     print(f"✅ LEGION TRINITY ENGINE: ATTACHED.")
 except ImportError:
     print("❌ CRITICAL: Run in .venv!")
@@ -16,72 +20,98 @@ except ImportError:
 
 SVG_FILE = "legion_galaxy.svg"
 
-# --- AUDIO ENGINE ---
-def generate_cymatic_tone(filename, frequency, duration_sec=1.0):
-    """Generates a .wav file based on the thought's resonance."""
-    sample_rate = 44100
-    n_samples = int(sample_rate * duration_sec)
-    
-    # Ensure frequency is audible (Clamp between 100Hz and 2000Hz)
-    audible_freq = max(100, min(frequency, 2000))
-    
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1) # Mono
-        wav_file.setsampwidth(2) # 2 bytes per sample
-        wav_file.setframerate(sample_rate)
-        
-        # Generate the wave data
-        data = []
-        for i in range(n_samples):
-            # Pure Sine Wave Math
-            t = i / sample_rate
-            value = int(32767.0 * math.sin(2 * math.pi * audible_freq * t))
-            data.append(struct.pack('<h', value))
-            
-        wav_file.writeframes(b''.join(data))
-    return audible_freq
-
-# --- VISUAL ENGINE ---
-def init_svg():
-    if not os.path.exists(SVG_FILE):
-        with open(SVG_FILE, "w", encoding="utf-8") as f:
-            f.write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="-500 -500 1000 1000" style="background-color:black;">\n')
-            f.write(f'\n')
-            f.write(f'<line x1="-50" y1="0" x2="50" y2="0" stroke="#333" stroke-width="1" />\n')
-            f.write(f'<line x1="0" y1="-50" x2="0" y2="50" stroke="#333" stroke-width="1" />\n')
-
-def append_star_to_svg(x, y, z, text):
-    hue = int((z * 30) % 360) 
-    color = f"hsl({hue}, 80%, 60%)"
-    svg_x = x * 10
-    svg_y = y * 10
-    
-    star_tag = (
-        f'  <circle cx="{svg_x:.2f}" cy="{svg_y:.2f}" r="4" fill="{color}" opacity="0.9">\n'
-        f'    <title>{text} (Res: {z:.2f})</title>\n'
-        f'    <animate attributeName="r" values="4;6;4" dur="2s" repeatCount="indefinite" />\n'
-        f'  </circle>\n'
-    )
-    
-    with open(SVG_FILE, "r+", encoding="utf-8") as f:
-        content = f.read()
-        if "</svg>" in content:
-            f.seek(0)
-            end_pos = content.rfind("</svg>")
-            f.seek(end_pos)
-            f.truncate()
-        else:
-            f.seek(0, 2)
-        f.write(star_tag)
-        f.write("</svg>")
-
 def vector_to_angle(vec):
     angle = np.arctan2(vec[1], vec[0]) 
     return (angle + np.pi) / (2 * np.pi)
 
+def vectors_to_angles(matrix):
+    """vector_to_angle for every row of an (n, dim) embedding matrix."""
+    matrix = np.asarray(matrix)
+    return (np.arctan2(matrix[:, 1], matrix[:, 0]) + np.pi) / (2 * np.pi)
+
+def wav_name(text, resonance):
+    safe_name = "".join([c for c in text[:10] if c.isalnum()])
+    return f"cymatics/{safe_name}_{int(resonance)}.wav"
+
+# --- STREAMING PIPELINE ---
+def read_thoughts(source):
+    """Yield non-empty thoughts from a file path, or stdin for '-'."""
+    stream = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+    try:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def map_batch(texts):
+    """Physics, logic and mapping for a whole batch: (resonances, angles, xyz)."""
+    freqs = np.fromiter((len(t) * 16.18 for t in texts), np.float64, len(texts))
+    embeddings = cortex.get_embeddings(texts)
+    angles = vectors_to_angles(embeddings)
+    resonances = legion_kernels.calculate_resonance_batch(freqs)
+    xyz = legion_kernels.map_to_spiral_batch(resonances, angles)
+    return resonances, angles, xyz
+
+def stream(source, batch_size=256, workers=4, audio=True):
+    """
+    Non-interactive mode: embed, map and render thoughts batch by batch.
+    The galaxy is written on its own thread (stars stay in input order) and
+    tones are rendered on a worker pool while the next batch is embedded.
+    """
+    galaxy = GalaxyWriter(SVG_FILE, flush_every=batch_size)
+    svg_pool = ThreadPoolExecutor(max_workers=1)
+    wav_pool = ThreadPoolExecutor(max_workers=workers)
+    pending = []
+    count = 0
+    start = time.perf_counter()
+    try:
+        for texts in batched(read_thoughts(source), batch_size):
+            resonances, _, xyz = map_batch(texts)
+            pending.append(svg_pool.submit(galaxy.add_many, xyz[:, 0], xyz[:, 1], xyz[:, 2], texts))
+            if audio:
+                jobs = [(wav_name(t, r), r) for t, r in zip(texts, resonances.tolist())]
+                pending.append(wav_pool.submit(render_batch, jobs, workers=1))
+            # Backpressure: never hold more than a few batches of output in flight
+            while len(pending) > 2 * (workers + 1):
+                pending.pop(0).result()
+            count += len(texts)
+            elapsed = time.perf_counter() - start
+            print(f" -> STREAMED: {count} thoughts ({count / elapsed:.1f} thoughts/s)", file=sys.stderr)
+        for future in pending:
+            future.result()
+    finally:
+        # Ctrl-C included: queued stars are drawn, then the buffer is flushed
+        svg_pool.shutdown(wait=True)
+        galaxy.close()
+        wav_pool.shutdown(wait=True, cancel_futures=True)
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"--- ✅ {count} thoughts in {elapsed:.2f}s ({rate:.1f} thoughts/s)")
+    return {"thoughts": count, "seconds": elapsed, "thoughts_per_sec": rate}
+
 # --- MAIN LOOP ---
 def main():
-    init_svg()
+    parser = argparse.ArgumentParser(description="Legion Trinity: text -> geometry -> sound.")
+    parser.add_argument("--stream", metavar="PATH", help="read thoughts from a file ('-' for stdin)")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--no-audio", action="store_true", help="skip WAV rendering in --stream mode")
+    args = parser.parse_args()
+    if args.stream:
+        os.makedirs("cymatics", exist_ok=True)
+        stream(args.stream, args.batch_size, args.workers, audio=not args.no_audio)
+        return
+
+    galaxy = GalaxyWriter(SVG_FILE, flush_every=1)
+    atexit.register(galaxy.close)  # flush whatever is buffered however the loop ends
     # Create an audio folder
     if not os.path.exists("cymatics"):
         os.makedirs("cymatics")
@@ -111,11 +141,10 @@ def main():
 
             # 4. EXECUTION
             # A. Draw the Star
-            append_star_to_svg(x, y, z, user_input)
+            galaxy.add(x, y, z, user_input)
             
             # B. Generate the Tone
-            safe_name = "".join([c for c in user_input[:10] if c.isalnum()])
-            wav_path = f"cymatics/{safe_name}_{int(resonance)}.wav"
+            wav_path = wav_name(user_input, resonance)
             final_freq = generate_cymatic_tone(wav_path, resonance)
 
             print(f" -> PROCESSED: '{user_input}'")
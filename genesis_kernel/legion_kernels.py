@@ -0,0 +1,102 @@
+"""Resonance and spiral-mapping kernels: Python reference + Rust dispatch.
+
+``legion_core_rs`` (the maturin-built crate in ``src/lib.rs``) implements the
+same functions; the pure-Python versions here are the reference the Rust
+kernels are checked against (``benchmarks/rust_parity.py``) and the fallback
+when the extension is not built.
+"""
+from __future__ import annotations
+
+import math
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from .backends import lookup, register, resolve_backend, rust_module
+except ImportError:  # imported as a top-level module by the infinity_loop.py script
+    from backends import lookup, register, resolve_backend, rust_module
+
+PHI = (1 + math.sqrt(5)) / 2
+LOVE_FREQ = 528.0
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+
+def calculate_resonance(freq: float) -> float:
+    """The PHI-scaled resonance of a base frequency."""
+    return freq * PHI
+
+
+def map_to_spiral(resonance: float, angle: float) -> Tuple[float, float, float]:
+    """
+    Place a thought on the golden spiral.
+    Radius grows with the square root of resonance (phyllotaxis packing), the
+    semantic ``angle`` in [0, 1) rotates it, and ``z`` is resonance in units
+    of the 528 Hz love frequency.
+    """
+    r = math.sqrt(max(resonance, 0.0))
+    theta = resonance * GOLDEN_ANGLE + 2 * math.pi * angle
+    return r * math.cos(theta), r * math.sin(theta), resonance / LOVE_FREQ
+
+
+def _as_f64(values) -> "np.ndarray":
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+
+def calculate_resonance_batch(freqs, backend: Optional[str] = None) -> "np.ndarray":
+    """Vectorised ``calculate_resonance`` over an array of frequencies."""
+    _, kernel = lookup("legion.calculate_resonance", resolve_backend(backend))
+    return np.asarray(kernel(_as_f64(freqs)), dtype=np.float64)
+
+
+def map_to_spiral_batch(resonances, angles, backend: Optional[str] = None) -> "np.ndarray":
+    """Vectorised ``map_to_spiral``; returns an ``(n, 3)`` array of x, y, z."""
+    resonances, angles = _as_f64(resonances), _as_f64(angles)
+    if resonances.shape != angles.shape:
+        raise ValueError("resonances and angles must have the same length.")
+    _, kernel = lookup("legion.map_to_spiral", resolve_backend(backend))
+    return np.asarray(kernel(resonances, angles), dtype=np.float64).reshape(-1, 3)
+
+
+# --- KERNELS (one per backend; see backends.py) ---
+@register("legion.calculate_resonance", "python")
+def _resonance_python(freqs):
+    return [calculate_resonance(f) for f in freqs.tolist()]
+
+
+@register("legion.calculate_resonance", "numpy")
+def _resonance_numpy(freqs):
+    return freqs * PHI
+
+
+@register("legion.calculate_resonance", "rust")
+def _resonance_rust(freqs):
+    out = np.empty_like(freqs)
+    rust_module().calculate_resonance_batch(freqs, out)
+    return out
+
+
+@register("legion.map_to_spiral", "python")
+def _spiral_python(resonances, angles):
+    return [map_to_spiral(r, a) for r, a in zip(resonances.tolist(), angles.tolist())]
+
+
+@register("legion.map_to_spiral", "numpy")
+def _spiral_numpy(resonances, angles):
+    out = np.empty((resonances.size, 3), dtype=np.float64)
+    r = np.sqrt(np.maximum(resonances, 0.0))
+    theta = resonances * GOLDEN_ANGLE + 2 * np.pi * angles
+    out[:, 0] = r * np.cos(theta)
+    out[:, 1] = r * np.sin(theta)
+    out[:, 2] = resonances / LOVE_FREQ
+    return out
+
+
+@register("legion.map_to_spiral", "rust")
+def _spiral_rust(resonances, angles):
+    out = np.empty((resonances.size, 3), dtype=np.float64)
+    rust_module().map_to_spiral_batch(resonances, angles, out)
+    return out
@@ -1,15 +1,19 @@
 """Love mathematics: harmonic resonance and relational fields."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+import math
 import statistics
-from typing import Iterable
+from typing import Deque, Iterable, Iterator, Optional
 
 try:
     import numpy as np
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     np = None
 
+from .backends import lookup, register, resolve_backend
 from .constants import UniversalConstants
 
 
@@ -18,6 +22,10 @@ class LoveMathematics:
     """Physics of connection via attraction, resonance, and coherence."""
 
     constants: UniversalConstants
+    backend: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.backend = resolve_backend(self.backend)
 
     def attract(self, entity1: float, entity2: float, distance: float = 1.0) -> float:
         """Inverse square law modulated by Phi (Love Gravity)."""
@@ -42,8 +50,28 @@ class LoveMathematics:
         values = list(data)
         if len(values) < 2:
             return 0.0
-        variance = np.var(values) if np else statistics.pvariance(values)
-        return self.constants.PHI / (1 + variance)
+        _, kernel = lookup("love.coherence_measure", self.backend)
+        return kernel(self, values)
+
+    def coherence_accumulator(self, window: Optional[int] = None,
+                              decay: Optional[float] = None) -> "CoherenceAccumulator":
+        """A streaming ``coherence_measure`` (see ``CoherenceAccumulator``)."""
+        return CoherenceAccumulator(self.constants.PHI, window=window, decay=decay)
+
+    def coherence_stream(self, data: Iterable[float], every: int = 1,
+                         window: Optional[int] = None,
+                         decay: Optional[float] = None) -> Iterator[float]:
+        """Yield the running coherence after every ``every`` samples of ``data``."""
+        if every < 1:
+            raise ValueError("every must be at least 1.")
+        acc = self.coherence_accumulator(window=window, decay=decay)
+        data = iter(data)
+        while True:
+            chunk = list(islice(data, every))
+            if not chunk:
+                return
+            acc.update(chunk)
+            yield acc.coherence
 
     def love_field_strength(self, radius: float) -> float:
         """Field strength of the Love Operator at radius r."""
@@ -54,3 +82,244 @@ class LoveMathematics:
         if not entities:
             return 0.0
         return sum(entities) * self.constants.PHI / len(entities)
+
+    # --- ARRAY OPERATORS (broadcasting; match the scalar methods bit-for-bit) ---
+    def _broadcast(self, kernel: str, *arrays) -> "np.ndarray":
+        arrays = [np.asarray(a, dtype=np.float64) for a in arrays]
+        backend, fn = lookup(kernel, self.backend)
+        if backend == "numpy":
+            # ufuncs broadcast natively; no need to materialise the full shape
+            return np.asarray(fn(self, *arrays), dtype=np.float64)
+        arrays = np.broadcast_arrays(*arrays)
+        shape = arrays[0].shape
+        flat = [np.ascontiguousarray(a).reshape(-1) for a in arrays]
+        return np.asarray(fn(self, *flat), dtype=np.float64).reshape(shape)
+
+    def attract_array(self, entity1, entity2, distance=1.0) -> "np.ndarray":
+        """``attract`` broadcast over arrays of entities and distances."""
+        return self._broadcast("love.attract", entity1, entity2, distance)
+
+    def resonate_pairwise(self, f1, f2) -> "np.ndarray":
+        """``resonate`` broadcast over two frequency arrays (elementwise pairs)."""
+        return self._broadcast("love.resonate", f1, f2)
+
+    def resonance_matrix(self, frequencies) -> "np.ndarray":
+        """
+        ``(N, N)`` resonance of every entity with every other.
+        Memory grows as N², so keep this to a few thousand entities; use
+        ``ResonanceMatrixEngine`` for larger sets.
+        """
+        f = np.asarray(frequencies, dtype=np.float64).reshape(-1)
+        return self.resonate_pairwise(f[:, None], f[None, :])
+
+    def love_field_strength_grid(self, radii) -> "np.ndarray":
+        """``love_field_strength`` over a radius grid of any shape."""
+        return self._broadcast("love.love_field_strength", radii)
+
+    def unite_array(self, entities, axis: int = -1) -> "np.ndarray":
+        """``unite`` of each group of entities laid out along ``axis``."""
+        groups = np.moveaxis(np.asarray(entities, dtype=np.float64), axis, -1)
+        shape = groups.shape[:-1]
+        if groups.shape[-1] == 0:
+            return np.zeros(shape)
+        _, fn = lookup("love.unite", self.backend)
+        flat = np.ascontiguousarray(groups).reshape(-1, groups.shape[-1])
+        return np.asarray(fn(self, flat), dtype=np.float64).reshape(shape)
+
+
+@dataclass
+class CoherenceAccumulator:
+    """
+    Online ``coherence_measure`` over an unbounded stream (Welford variance).
+    Three modes:
+      * default - every sample so far; partial accumulators from parallel
+        workers combine with ``merge``.
+      * ``window=n`` - only the last ``n`` samples.
+      * ``decay=d`` - each new sample scales older weights by ``d`` (0 < d < 1),
+        an exponentially weighted variance with an effective memory of
+        ``1 / (1 - d)`` samples.
+    """
+
+    phi: float
+    window: Optional[int] = None
+    decay: Optional[float] = None
+    count: int = 0
+    weight: float = 0.0
+    mean: float = 0.0
+    m2: float = 0.0
+    _recent: Deque[float] = field(default_factory=deque, init=False, repr=False)
+    _removed: int = field(default=0, init=False, repr=False)
+
+    # Above this many values, plain-mode ``update`` folds chunk statistics
+    # computed by NumPy instead of looping in Python
+    CHUNK = 4096
+
+    def __post_init__(self) -> None:
+        if self.window is not None and self.decay is not None:
+            raise ValueError("Choose either window or decay, not both.")
+        if self.window is not None and self.window < 2:
+            raise ValueError("window must hold at least 2 samples.")
+        if self.decay is not None and not 0.0 < self.decay < 1.0:
+            raise ValueError("decay must be between 0 and 1 (exclusive).")
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the samples currently in view."""
+        if self.count < 2 or self.weight <= 0:
+            return 0.0
+        return max(self.m2 / self.weight, 0.0)
+
+    @property
+    def coherence(self) -> float:
+        """``PHI / (1 + variance)``; 0.0 until two samples have arrived."""
+        if self.count < 2:
+            return 0.0
+        return self.phi / (1 + self.variance)
+
+    def add(self, value: float) -> float:
+        """Fold in one sample and return the updated coherence."""
+        value = float(value)
+        if self.decay is not None:
+            self.weight = self.weight * self.decay + 1.0
+            self.m2 *= self.decay
+        else:
+            self.weight += 1.0
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.weight
+        self.m2 += delta * (value - self.mean)
+        if self.window is not None:
+            self._recent.append(value)
+            if len(self._recent) > self.window:
+                self._evict(self._recent.popleft())
+        return self.coherence
+
+    def update(self, values: Iterable[float]) -> float:
+        """Fold in many samples; return the updated coherence."""
+        if self.window is None and self.decay is None and np is not None:
+            values = iter(values)
+            while True:
+                chunk = np.fromiter(islice(values, self.CHUNK), dtype=np.float64)
+                if not chunk.size:
+                    return self.coherence
+                mean = float(chunk.mean())
+                self._combine(chunk.size, float(chunk.size), mean,
+                              float(np.square(chunk - mean).sum()))
+        for value in values:
+            self.add(value)
+        return self.coherence
+
+    def merge(self, other: "CoherenceAccumulator") -> "CoherenceAccumulator":
+        """
+        Fold another accumulator's samples into this one (Chan et al.), e.g.
+        the partial results of parallel workers. Sliding windows keep sample
+        order, so they cannot be merged.
+        """
+        if self.window is not None or other.window is not None:
+            raise ValueError("Windowed accumulators cannot be merged.")
+        if self.decay != other.decay:
+            raise ValueError("Accumulators with different decay cannot be merged.")
+        self._combine(other.count, other.weight, other.mean, other.m2)
+        return self
+
+    def _combine(self, count: int, weight: float, mean: float, m2: float) -> None:
+        if weight <= 0:
+            return
+        total = self.weight + weight
+        delta = mean - self.mean
+        self.mean += delta * weight / total
+        self.m2 += m2 + delta * delta * self.weight * weight / total
+        self.weight = total
+        self.count += count
+
+    def _evict(self, value: float) -> None:
+        self.count -= 1
+        self.weight -= 1.0
+        delta = value - self.mean
+        self.mean -= delta / self.weight
+        self.m2 -= delta * (value - self.mean)
+        # Removal slowly accumulates rounding error; re-derive the moments
+        # from the window once per full turnover (amortised O(1))
+        self._removed += 1
+        if self._removed >= self.window:
+            self._removed = 0
+            self.mean = math.fsum(self._recent) / len(self._recent)
+            self.m2 = math.fsum((v - self.mean) ** 2 for v in self._recent)
+
+
+# --- KERNELS (one per backend; see backends.py) ---
+# The scalar methods above are the reference; these apply them elementwise.
+def _as_list(values) -> list:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+@register("love.attract", "python")
+def _attract_python(love: LoveMathematics, entity1, entity2, distance):
+    rows = zip(_as_list(entity1), _as_list(entity2), _as_list(distance))
+    return [love.attract(a, b, d) for a, b, d in rows]
+
+
+@register("love.resonate", "python")
+def _resonate_python(love: LoveMathematics, f1, f2):
+    return [love.resonate(a, b) for a, b in zip(_as_list(f1), _as_list(f2))]
+
+
+@register("love.love_field_strength", "python")
+def _field_python(love: LoveMathematics, radii):
+    return [love.love_field_strength(r) for r in _as_list(radii)]
+
+
+@register("love.unite", "python")
+def _unite_python(love: LoveMathematics, groups):
+    return [love.unite(*group) for group in _as_list(groups)]
+
+
+@register("love.coherence_measure", "python")
+def _coherence_python(love: LoveMathematics, values):
+    return love.constants.PHI / (1 + statistics.pvariance(values))
+
+
+@register("love.coherence_measure", "numpy")
+def _coherence_numpy(love: LoveMathematics, values):
+    return love.constants.PHI / (1 + np.var(values))
+
+
+# Python's ``x**2`` calls libm pow(), while NumPy turns ``x**2`` into x*x;
+# they disagree in the last bit for ~0.1% of inputs. float_power goes
+# through pow() too, which keeps the array results bit-identical.
+def _squared(values):
+    return np.float_power(values, 2)
+
+
+@register("love.attract", "numpy")
+def _attract_numpy(love: LoveMathematics, entity1, entity2, distance):
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        force = (love.constants.PHI * entity1 * entity2) / _squared(distance)
+    return np.where(distance <= 0, np.inf, force)
+
+
+@register("love.resonate", "numpy")
+def _resonate_numpy(love: LoveMathematics, f1, f2):
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ratio = np.maximum(f1, f2) / np.minimum(f1, f2)
+        deviation = np.minimum(
+            np.minimum(np.abs(ratio - 1.0), np.abs(ratio - 1.5)),
+            np.abs(ratio - love.constants.PHI),
+        )
+        score = 1.0 / (1.0 + deviation * 10)
+    return np.where((f1 == 0) | (f2 == 0), 0.0, score)
+
+
+@register("love.love_field_strength", "numpy")
+def _field_numpy(love: LoveMathematics, radii):
+    return (144 * love.constants.PHI) / (_squared(radii) + 1)
+
+
+@register("love.unite", "numpy")
+def _unite_numpy(love: LoveMathematics, groups):
+    # Left-to-right column sums reproduce Python's sum() rounding exactly;
+    # np.sum's pairwise order could differ in the last bit.
+    total = groups[:, 0].copy()
+    for column in range(1, groups.shape[1]):
+        total += groups[:, column]
+    return total * love.constants.PHI / groups.shape[1]
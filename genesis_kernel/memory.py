@@ -1,13 +1,22 @@
 """The Oubliette: Permanent Associative Memory."""
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
 import json
+import mmap
+import threading
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Union
 
-@dataclass
+from .engram_log import SegmentedEngramLog
+from .engram_table import EngramTable
+from .engram_writer import EngramWriter, GroupCommitPolicy, JsonlSink
+
+@dataclass(slots=True)
 class MemoryEngram:
     """A single unit of crystallized thought."""
     timestamp: float
@@ -18,15 +27,201 @@ class MemoryEngram:
     decision: str
     method: str
 
+class _MappedPart:
+    """A memory-mapped log file plus the byte spans of its records."""
+
+    def __init__(self, path: Path, size: int, offsets: Optional[array] = None,
+                 lengths: Optional[array] = None):
+        self.path = path
+        self.size = size
+        self.offsets = offsets
+        self.lengths = lengths
+        self._map: Optional[mmap.mmap] = None
+
+    def buffer(self) -> Union[mmap.mmap, bytes]:
+        if not self.size:
+            return b""
+        if self._map is None:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), self.size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def close(self) -> None:
+        """Unmap the file; a later read maps it again."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __len__(self) -> int:
+        return len(self.spans()[0])
+
+    def spans(self) -> "tuple[array, array]":
+        """Line spans, found by a newline scan the first time they are needed."""
+        if self.offsets is None:
+            buf = self.buffer()
+            offsets, lengths = array("Q"), array("I")
+            start = 0
+            while start < self.size:
+                end = buf.find(b"\n", start)
+                if end < 0:
+                    break  # torn final line, not yet a record
+                if buf[start:end].strip():
+                    offsets.append(start)
+                    lengths.append(end - start)
+                start = end + 1
+            self.offsets, self.lengths = offsets, lengths
+        return self.offsets, self.lengths
+
+    def decode(self, position: int) -> MemoryEngram:
+        offsets, lengths = self.spans()
+        start = offsets[position]
+        return MemoryEngram(**json.loads(self.buffer()[start:start + lengths[position]]))
+
+
+class EngramView(Sequence):
+    """
+    Lazy, read-only sequence of engrams over memory-mapped log files.
+    Records are decoded only when touched; slices are views, not copies.
+    The mapped extent is fixed at recall time; engrams memorized afterwards
+    are kept in an in-memory tail. ``close()`` (or a ``with`` block) unmaps
+    the files.
+    """
+
+    def __init__(self, parts: List[_MappedPart], tail: Optional[List[MemoryEngram]] = None,
+                 select: Optional[range] = None, bounds: Optional[List[int]] = None):
+        self._parts = parts
+        self._tail = tail if tail is not None else []
+        self._select = select
+        self._bounds = bounds
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "EngramView":
+        path = Path(path)
+        return cls([_MappedPart(path, path.stat().st_size)])
+
+    @classmethod
+    def from_store(cls, store: SegmentedEngramLog) -> "EngramView":
+        return cls([
+            _MappedPart(
+                segment.data_path,
+                segment.indexed_bytes,
+                segment.offsets[:],
+                segment.lengths[:],
+            )
+            for segment in store.segments
+            if segment.offsets
+        ])
+
+    def _cumulative(self) -> List[int]:
+        if self._bounds is None:
+            total, bounds = 0, []
+            for part in self._parts:
+                total += len(part)
+                bounds.append(total)
+            self._bounds = bounds
+        return self._bounds
+
+    def _mapped_len(self) -> int:
+        bounds = self._cumulative()
+        return bounds[-1] if bounds else 0
+
+    def _full_len(self) -> int:
+        return self._mapped_len() + len(self._tail)
+
+    def _decode(self, index: int) -> MemoryEngram:
+        mapped = self._mapped_len()
+        if index >= mapped:
+            return self._tail[index - mapped]
+        bounds = self._cumulative()
+        part_no = bisect_right(bounds, index)
+        start = bounds[part_no - 1] if part_no else 0
+        return self._parts[part_no].decode(index - start)
+
+    def __len__(self) -> int:
+        if self._select is not None:
+            return len(self._select)
+        return self._full_len()
+
+    def __getitem__(self, index):
+        indices = self._select if self._select is not None else range(self._full_len())
+        if isinstance(index, slice):
+            return EngramView(self._parts, self._tail, indices[index], self._cumulative())
+        return self._decode(indices[index])
+
+    def __iter__(self) -> Iterator[MemoryEngram]:
+        if self._select is not None:
+            for index in self._select:
+                yield self._decode(index)
+            return
+        for part in self._parts:
+            for position in range(len(part)):
+                yield part.decode(position)
+        yield from self._tail
+
+    def append(self, engram: MemoryEngram) -> None:
+        """Add a freshly memorized engram after the mapped snapshot."""
+        if self._select is not None:
+            raise TypeError("cannot append to a sliced EngramView")
+        self._tail.append(engram)
+
+    def close(self) -> None:
+        """Release the memory maps (shared with any slices of this view)."""
+        for part in self._parts:
+            part.close()
+
+    def __enter__(self) -> "EngramView":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 class Oubliette:
     """
     The Permanent Storage Layer.
     Writes high-resonance thoughts to a distinct timeline.
+    With ``segmented=True`` the timeline lives in an indexed segment
+    directory next to ``filename``, which is still read as legacy history.
+    A ``commit_policy`` turns on buffered, group-committed writes; the
+    background committer and every store read share one lock.
+    An attached ThoughtIndex receives every thought memorized.
     """
-    def __init__(self, filename: str = "memory.jsonl"):
+    def __init__(
+        self,
+        filename: str = "memory.jsonl",
+        segmented: bool = False,
+        commit_policy: Optional[GroupCommitPolicy] = None,
+    ):
         self.filepath = Path(filename)
-        self._cache: List[MemoryEngram] = []
-        self.ensure_existence()
+        self._cache: Union[EngramTable, EngramView] = EngramTable()
+        self.store: Optional[SegmentedEngramLog] = None
+        self.writer: Optional[EngramWriter] = None
+        self._queued_ids: set = set()
+        self._lock = threading.RLock()
+        self.thought_index = None
+        self._embed: Optional[Callable[[List[str]], List[object]]] = None
+        if segmented:
+            self.store = SegmentedEngramLog(
+                self.filepath.with_suffix(".segments"), legacy=self.filepath
+            )
+        else:
+            self.ensure_existence()
+        if commit_policy is not None:
+            sink = self.store if self.store is not None else JsonlSink(self.filepath)
+            self.writer = EngramWriter(
+                sink, commit_policy, io_lock=self._lock, on_commit=self._committed
+            )
+
+    def _committed(self, engrams: List[Dict]) -> None:
+        # Flushed ids are in the store now; only the pending batch stays queued
+        self._queued_ids.difference_update(e["synthesis_id"] for e in engrams)
+
+    def attach_index(self, index, embed: Optional[Callable[[List[str]], List[object]]]) -> None:
+        """
+        Keep a ThoughtIndex current: memorize() embeds each new thought with
+        ``embed`` and adds it. ``attach_index(None, None)`` detaches.
+        """
+        self.thought_index, self._embed = index, embed
 
     def ensure_existence(self):
         """Create the memory file if it doesn't exist."""
@@ -34,39 +229,146 @@ class Oubliette:
             self.filepath.touch()
             print(f"🌑 OUBLIETTE CREATED: {self.filepath}")
 
-    def recall(self) -> List[Dict]:
+    def recall(self, lazy: bool = False) -> Union[EngramTable, EngramView]:
         """
         Load all past memories into consciousness.
+        Records stream straight into the columnar EngramTable, which is
+        returned; no list of dicts is built. With ``lazy=True`` the log is
+        memory-mapped and an EngramView is returned instead; nothing is
+        parsed until it is touched.
+        Buffered thoughts are flushed first so the recall includes them.
         """
-        memories = []
+        self.flush()
+        if lazy:
+            if self.store is not None:
+                with self._lock:
+                    self._cache = EngramView.from_store(self.store)
+            else:
+                self._cache = EngramView.from_file(self.filepath)
+            print(f"🕯️ OUBLIETTE RECALL: Mapped {self.filepath} (lazy).")
+            return self._cache
+        table = EngramTable()
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        data = json.loads(line)
-                        memories.append(data)
-            self._cache = [MemoryEngram(**m) for m in memories]
+            if self.store is not None:
+                with self._lock:
+                    table.extend(self.store)
+            else:
+                with open(self.filepath, "r", encoding="utf-8") as f:
+                    table.extend(json.loads(line) for line in f if line.strip())
+            self._cache = table
             count = len(self._cache)
             print(f"🕯️ OUBLIETTE RECALL: Restored {count} crystallized thoughts.")
-            return memories
+            return self._cache
         except Exception as e:
             print(f"⚠️ MEMORY CORRUPTION: {e}")
-            return []
+            return EngramTable()
+
+    def lookup(self, synthesis_id: str) -> Optional[Dict]:
+        """
+        Find a thought by synthesis id (indexed when segmented).
+        """
+        if self.store is not None:
+            with self._lock:
+                return self.store.get(synthesis_id)
+        if isinstance(self._cache, EngramTable):
+            row = self._cache.find(synthesis_id)
+            return row.asdict() if row is not None else None
+        for engram in reversed(self._cache):
+            if engram.synthesis_id == synthesis_id:
+                return asdict(engram)
+        return None
+
+    def between(self, start: float, end: float) -> List[Dict]:
+        """
+        Return thoughts crystallized within ``[start, end]`` (epoch seconds).
+        """
+        if self.store is not None:
+            with self._lock:
+                return list(self.store.between(start, end))
+        if isinstance(self._cache, EngramTable):
+            return [row.asdict() for row in self._cache.between(start, end)]
+        return [asdict(e) for e in self._cache if start <= e.timestamp <= end]
 
     def memorize(self, engram_data: Dict):
         """
         Commit a high-resonance thought to permanent storage.
         """
+        self.memorize_many([engram_data])
+
+    def memorize_many(self, engrams: List[Dict]) -> int:
+        """
+        Commit a group of thoughts in a single write; return how many were kept.
+        """
         # Add timestamp
-        engram_data["timestamp"] = time.time()
-        
-        # Write to disk (Append Mode)
-        with open(self.filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(engram_data) + "\n")
-        
+        now = time.time()
+        for engram_data in engrams:
+            engram_data["timestamp"] = now
+
+        if self.store is not None:
+            # Dedup-on-write: a known synthesis_id is not stored again
+            fresh, seen = [], set()
+            with self._lock:
+                for engram_data in engrams:
+                    synthesis_id = engram_data["synthesis_id"]
+                    if synthesis_id in self.store or synthesis_id in self._queued_ids or synthesis_id in seen:
+                        continue
+                    seen.add(synthesis_id)
+                    fresh.append(engram_data)
+                if self.writer is not None:
+                    # Queued ids are not in the store until the group commits
+                    self._queued_ids.update(seen)
+            engrams = fresh
+        if not engrams:
+            return 0
+
+        if self.writer is not None:
+            self.writer.write_many(engrams)
+        elif self.store is not None:
+            with self._lock:
+                self.store.append_many(engrams)
+        else:
+            # Write to disk (Append Mode)
+            with open(self.filepath, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(e) + "\n" for e in engrams))
+
         # Update cache
         try:
-            self._cache.append(MemoryEngram(**engram_data))
-            print(f"💾 THOUGHT CRYSTALLIZED: {engram_data['synthesis_id']}")
+            for engram_data in engrams:
+                if isinstance(self._cache, EngramView):
+                    self._cache.append(MemoryEngram(**engram_data))
+                else:
+                    self._cache.append(engram_data)
+            if len(engrams) == 1:
+                print(f"💾 THOUGHT CRYSTALLIZED: {engrams[0]['synthesis_id']}")
+            else:
+                print(f"💾 {len(engrams)} THOUGHTS CRYSTALLIZED.")
         except:
             pass # Non-critical cache failure
+
+        if self.thought_index is not None:
+            try:
+                self.thought_index.build_from_oubliette(engrams, self._embed)
+            except Exception as e:
+                print(f"⚠️ THOUGHT INDEX UPDATE FAILED: {e}")
+        return len(engrams)
+
+    def flush(self) -> int:
+        """
+        Commit any buffered thoughts now.
+        """
+        return self.writer.flush() if self.writer is not None else 0
+
+    def close(self):
+        """
+        Flush buffered thoughts, release the writer and unmap a lazy recall.
+        """
+        if self.writer is not None:
+            self.writer.close()
+        if isinstance(self._cache, EngramView):
+            self._cache.close()
+
+    def __enter__(self) -> "Oubliette":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
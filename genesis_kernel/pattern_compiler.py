@@ -0,0 +1,289 @@
+"""Compile PatternTransformation steps into executable vectorised pipelines."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+import math
+import operator
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .backends import lookup, register, resolve_backend, rust_module
+
+# Stack-machine opcodes (mirrored by PatternEngineRS.run_program in src/lib.rs)
+OP_INPUT, OP_CONST, OP_DUP, OP_ADD, OP_SUB, OP_MUL, OP_NEG, OP_SWAP, OP_POP = range(9)
+MAX_STACK = 16
+
+# (values popped, values pushed) per opcode
+_STACK_EFFECT = {
+    OP_INPUT: (0, 1), OP_CONST: (0, 1), OP_DUP: (1, 2), OP_ADD: (2, 1), OP_SUB: (2, 1),
+    OP_MUL: (2, 1), OP_NEG: (1, 1), OP_SWAP: (2, 2), OP_POP: (1, 0),
+}
+
+_SCALAR_OPS = {OP_ADD: operator.add, OP_SUB: operator.sub, OP_MUL: operator.mul}
+
+Instruction = Tuple[int, float]  # (opcode, constant; 0.0 unless OP_CONST)
+
+# Step vocabulary: each step name expands to stack instructions.
+# "receive" pushes the original input; binary steps combine the top two.
+STEPS: Dict[str, Tuple[Instruction, ...]] = {
+    "receive": ((OP_INPUT, 0.0),),
+    "duplicate": ((OP_DUP, 0.0),),
+    "multiply-with-self": ((OP_DUP, 0.0), (OP_MUL, 0.0)),
+    "square": ((OP_DUP, 0.0), (OP_MUL, 0.0)),
+    "double": ((OP_CONST, 2.0), (OP_MUL, 0.0)),
+    "double-original": ((OP_INPUT, 0.0), (OP_CONST, 2.0), (OP_MUL, 0.0)),
+    "halve": ((OP_CONST, 0.5), (OP_MUL, 0.0)),
+    "negate": ((OP_NEG, 0.0),),
+    "combine": ((OP_ADD, 0.0),),
+    "subtract": ((OP_SUB, 0.0),),
+    "multiply": ((OP_MUL, 0.0),),
+    "add-unity": ((OP_CONST, 1.0), (OP_ADD, 0.0)),
+    "subtract-unity": ((OP_CONST, 1.0), (OP_SUB, 0.0)),
+    "add-original": ((OP_INPUT, 0.0), (OP_ADD, 0.0)),
+    "multiply-original": ((OP_INPUT, 0.0), (OP_MUL, 0.0)),
+    "scale-phi": ((OP_CONST, (1 + math.sqrt(5)) / 2), (OP_MUL, 0.0)),
+    "swap": ((OP_SWAP, 0.0),),
+    "discard": ((OP_POP, 0.0),),
+}
+
+
+def register_step(name: str, *instructions: Instruction) -> None:
+    """Bind (or rebind) a step name to stack instructions."""
+    for op, _ in instructions:
+        if op not in _STACK_EFFECT:
+            raise ValueError(f"Unknown opcode {op!r} in step {name!r}.")
+    STEPS[name] = tuple((int(op), float(arg)) for op, arg in instructions)
+    _compile.cache_clear()
+
+
+@dataclass(frozen=True)
+class PatternProgram:
+    """Validated stack program for one sequence of pattern steps."""
+
+    name: str
+    steps: Tuple[str, ...]
+    code: Tuple[Instruction, ...]
+
+    @classmethod
+    def from_steps(cls, steps: Sequence[str], name: str = "pattern") -> "PatternProgram":
+        code: List[Instruction] = []
+        depth = 0
+        for step in steps:
+            if step not in STEPS:
+                raise ValueError(f"Step {step!r} has no operation bound (see register_step).")
+            for op, arg in STEPS[step]:
+                pops, pushes = _STACK_EFFECT[op]
+                if depth < pops:
+                    raise ValueError(f"Step {step!r} needs {pops} values but the stack holds {depth}.")
+                depth += pushes - pops
+                if depth > MAX_STACK:
+                    raise ValueError(f"Pattern {name!r} exceeds the {MAX_STACK}-value stack.")
+                code.append((op, arg))
+        if depth == 0:
+            raise ValueError(f"Pattern {name!r} leaves no result on the stack.")
+        return cls(name, tuple(steps), tuple(code))
+
+    def run_scalar(self, value: float) -> float:
+        """Reference interpreter: the top of the stack after every step."""
+        stack: List[float] = []
+        for op, arg in self.code:
+            if op == OP_INPUT:
+                stack.append(value)
+            elif op == OP_CONST:
+                stack.append(arg)
+            elif op == OP_DUP:
+                stack.append(stack[-1])
+            elif op == OP_NEG:
+                stack[-1] = -stack[-1]
+            elif op == OP_SWAP:
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+            elif op == OP_POP:
+                stack.pop()
+            else:
+                b = stack.pop()
+                stack[-1] = _SCALAR_OPS[op](stack[-1], b)
+        return stack[-1]
+
+    @cached_property
+    def bytecode(self):
+        """``(codes, consts)`` arrays for the Rust VM: (opcode, const index) pairs."""
+        import numpy as np
+
+        consts: List[float] = []
+        codes: List[int] = []
+        for op, arg in self.code:
+            codes += [op, len(consts) if op == OP_CONST else 0]
+            if op == OP_CONST:
+                consts.append(arg)
+        return np.array(codes, dtype=np.int64), np.array(consts or [0.0], dtype=np.float64)
+
+    @cached_property
+    def plan(self) -> "_NumpyPlan":
+        return _NumpyPlan(self)
+
+
+class _NumpyPlan:
+    """
+    The program flattened to ufunc calls over a few scratch registers.
+    DUP/SWAP/POP only move references, constant-only operations fold and
+    discarded values are dropped at compile time, so each remaining step is
+    one ufunc call. Inputs run in cache-sized chunks and a register is reused
+    as soon as its value is dead, which keeps the fused pipeline's
+    temporaries in L2.
+    """
+
+    chunk = 16_384
+
+    def __init__(self, program: PatternProgram):
+        import numpy as np
+
+        ufuncs = {OP_ADD: np.add, OP_SUB: np.subtract, OP_MUL: np.multiply}
+        # Symbolic execution: stack entries are ("x",), ("c", value) or ("v", index)
+        ops: List[Tuple[Callable, tuple, Optional[tuple]]] = []
+        stack: List[tuple] = []
+        for op, arg in program.code:
+            if op == OP_INPUT:
+                stack.append(("x",))
+            elif op == OP_CONST:
+                stack.append(("c", arg))
+            elif op == OP_DUP:
+                stack.append(stack[-1])
+            elif op == OP_SWAP:
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+            elif op == OP_POP:
+                stack.pop()
+            elif op == OP_NEG:
+                a = stack.pop()
+                if a[0] == "c":
+                    stack.append(("c", -a[1]))
+                else:
+                    ops.append((np.negative, a, None))
+                    stack.append(("v", len(ops) - 1))
+            else:
+                b, a = stack.pop(), stack.pop()
+                if a[0] == "c" and b[0] == "c":
+                    stack.append(("c", _SCALAR_OPS[op](a[1], b[1])))
+                else:
+                    ops.append((ufuncs[op], a, b))
+                    stack.append(("v", len(ops) - 1))
+        self.result = stack[-1]
+
+        # Dead-code elimination: keep only the ops the result depends on
+        live, pending = set(), [self.result]
+        while pending:
+            ref = pending.pop()
+            if ref is not None and ref[0] == "v" and ref[1] not in live:
+                live.add(ref[1])
+                pending.extend(ops[ref[1]][1:])
+
+        # Register allocation by liveness; the last op writes the output directly
+        last_use: Dict[int, int] = {}
+        for i in sorted(live):
+            for ref in ops[i][1:]:
+                if ref is not None and ref[0] == "v":
+                    last_use[ref[1]] = i
+        self.register: Dict[int, int] = {}
+        free: List[int] = []
+        self.n_registers = 0
+        self.steps: List[Tuple[int, Callable, tuple, Optional[tuple]]] = []
+        for i in sorted(live):
+            ufunc, a, b = ops[i]
+            dying = {ref[1] for ref in (a, b) if ref is not None and ref[0] == "v" and last_use[ref[1]] == i}
+            free.extend(self.register[v] for v in sorted(dying))
+            if i != self.result[1]:
+                if free:
+                    self.register[i] = free.pop()
+                else:
+                    self.register[i] = self.n_registers
+                    self.n_registers += 1
+            self.steps.append((i, ufunc, a, b))
+
+    def __call__(self, values: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        out = np.empty(values.size, dtype=np.float64)
+        kind = self.result[0]
+        if kind == "c":
+            out.fill(self.result[1])
+            return out
+        if kind == "x":
+            out[...] = values
+            return out
+        size = min(self.chunk, values.size)
+        scratch = [np.empty(size, dtype=np.float64) for _ in range(self.n_registers)]
+        final = self.result[1]
+        for start in range(0, values.size, self.chunk):
+            x = values[start:start + self.chunk]
+            m = x.size
+            regs = [r[:m] for r in scratch]
+
+            def resolve(ref):
+                if ref[0] == "x":
+                    return x
+                if ref[0] == "c":
+                    return ref[1]
+                return regs[self.register[ref[1]]]
+
+            for i, ufunc, a, b in self.steps:
+                target = out[start:start + m] if i == final else regs[self.register[i]]
+                if b is None:
+                    ufunc(resolve(a), out=target)
+                else:
+                    ufunc(resolve(a), resolve(b), out=target)
+        return out
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """A compiled pattern bound to the backend that executes it."""
+
+    program: PatternProgram
+    backend: str
+    kernel: Callable
+
+    def __call__(self, values):
+        """Run the pattern over a scalar or array of any shape."""
+        import numpy as np
+
+        array = np.asarray(values, dtype=np.float64)
+        flat = np.ascontiguousarray(array).reshape(-1)
+        result = np.asarray(self.kernel(self.program, flat), dtype=np.float64).reshape(array.shape)
+        return float(result) if result.ndim == 0 else result
+
+
+def compile_pattern(pattern, backend: Optional[str] = None) -> CompiledPattern:
+    """
+    Compile a ``PatternTransformation`` (or a list of step names) once per
+    step sequence and backend; repeated calls return the cached function.
+    """
+    steps = tuple(getattr(pattern, "steps", pattern))
+    name = getattr(pattern, "name", "pattern")
+    return _compile(steps, name, resolve_backend(backend))
+
+
+@lru_cache(maxsize=256)
+def _compile(steps: Tuple[str, ...], name: str, backend: str) -> CompiledPattern:
+    program = PatternProgram.from_steps(steps, name)
+    used, kernel = lookup("pattern.program", backend)
+    return CompiledPattern(program, used, kernel)
+
+
+# --- KERNELS (one per backend; see backends.py) ---
+@register("pattern.program", "python")
+def _program_python(program: PatternProgram, values):
+    return [program.run_scalar(v) for v in values.tolist()]
+
+
+@register("pattern.program", "numpy")
+def _program_numpy(program: PatternProgram, values):
+    return program.plan(values)
+
+
+@register("pattern.program", "rust")
+def _program_rust(program: PatternProgram, values):
+    import numpy as np
+
+    out = np.empty(values.size, dtype=np.float64)
+    codes, consts = program.bytecode
+    rust_module().PatternEngineRS.run_program(codes, consts, values, out)
+    return out
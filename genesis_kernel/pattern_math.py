@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable, List
+from typing import Iterable, List, Optional
+
+from .backends import lookup, register, resolve_backend, rust_module
 
 
 @dataclass(frozen=True)
@@ -16,6 +18,16 @@ class PatternTransformation:
         """Return a human-readable pattern description."""
         return f"{self.name}: " + " → ".join(self.steps)
 
+    def compile(self, backend: Optional[str] = None):
+        """Executable, vectorised form of the steps (cached; see pattern_compiler)."""
+        from .pattern_compiler import compile_pattern
+
+        return compile_pattern(self, backend)
+
+    def run(self, values, backend: Optional[str] = None):
+        """Apply the pattern to a scalar or array of inputs."""
+        return self.compile(backend)(values)
+
 
 @dataclass(frozen=True)
 class PatternComposition:
@@ -100,3 +112,51 @@ def summarize_properties(properties: Iterable[StructuralProperty]) -> str:
 def compose_patterns(*patterns: PatternTransformation) -> PatternComposition:
     """Compose multiple patterns into a single pipeline."""
     return PatternComposition(transformations=list(patterns))
+
+
+def quadratic_growth_stream(value: float) -> List[float]:
+    """
+    Execution trace of the quadratic-growth pattern for one input:
+    receive, multiply-with-self, double-original, combine, add-unity.
+    """
+    square = value * value
+    double = value * 2.0
+    combine = square + double
+    return [value, square, double, combine, combine + 1.0]
+
+
+def quadratic_growth_batch(values, backend: Optional[str] = None):
+    """Traces for many inputs as an ``(n, 5)`` array (one row per input)."""
+    import numpy as np
+
+    values = np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+    _, kernel = lookup("pattern.quadratic_growth", resolve_backend(backend))
+    return np.asarray(kernel(values), dtype=np.float64).reshape(-1, 5)
+
+
+# --- KERNELS (one per backend; see backends.py) ---
+@register("pattern.quadratic_growth", "python")
+def _quadratic_python(values):
+    return [quadratic_growth_stream(v) for v in values.tolist()]
+
+
+@register("pattern.quadratic_growth", "numpy")
+def _quadratic_numpy(values):
+    import numpy as np
+
+    out = np.empty((values.size, 5), dtype=np.float64)
+    out[:, 0] = values
+    np.multiply(values, values, out=out[:, 1])
+    np.multiply(values, 2.0, out=out[:, 2])
+    np.add(out[:, 1], out[:, 2], out=out[:, 3])
+    np.add(out[:, 3], 1.0, out=out[:, 4])
+    return out
+
+
+@register("pattern.quadratic_growth", "rust")
+def _quadratic_rust(values):
+    import numpy as np
+
+    out = np.empty((values.size, 5), dtype=np.float64)
+    rust_module().PatternEngineRS.quadratic_growth_batch(values, out)
+    return out
@@ -0,0 +1,119 @@
+"""Quantised embedding storage (float16 / per-vector int8) and kernels."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+MODES = ("float32", "float16", "int8")
+WIDEN_ROWS = 4_096  # compact rows widened to float32 per block in quantized_dot
+
+
+@dataclass(frozen=True)
+class QuantizedVectors:
+    """
+    Row-major vectors in a compact storage mode.
+    ``int8`` keeps one float32 scale per vector (symmetric, max-abs / 127),
+    so a 384-dim MiniLM embedding costs 388 bytes instead of 1536.
+    """
+
+    mode: str
+    data: "np.ndarray"
+    scales: Optional["np.ndarray"] = None
+
+    def __len__(self) -> int:
+        return int(self.data.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.data.nbytes + (0 if self.scales is None else self.scales.nbytes))
+
+    def dequantize(self) -> "np.ndarray":
+        return dequantize(self.data, self.scales)
+
+    def dot(self, query: "np.ndarray") -> "np.ndarray":
+        """Dot product of every stored vector with ``query``."""
+        return quantized_dot(self.data, self.scales, query)
+
+
+def quantize(vectors: "np.ndarray", mode: str = "int8") -> QuantizedVectors:
+    """Quantise a ``(n, dim)`` (or single ``(dim,)``) float array."""
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}, got {mode!r}.")
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    if mode != "int8":
+        return QuantizedVectors(mode, vectors.astype(mode))
+    peak = np.abs(vectors).max(axis=1)
+    scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return QuantizedVectors(mode, codes, scales)
+
+
+def dequantize(data: "np.ndarray", scales: Optional["np.ndarray"] = None) -> "np.ndarray":
+    """Recover float32 vectors from stored rows (and int8 scales)."""
+    rows = np.asarray(data, dtype=np.float32)
+    if scales is None:
+        return rows
+    return rows * np.asarray(scales, dtype=np.float32)[..., None]
+
+
+def quantized_dot(
+    data: "np.ndarray", scales: Optional["np.ndarray"], query: "np.ndarray"
+) -> "np.ndarray":
+    """
+    Dot products computed on the stored form.
+    float16 and int8 rows are widened to float32 one ``WIDEN_ROWS`` block at
+    a time into a reused buffer, so a query never copies the whole matrix.
+    For int8 the per-vector scale is applied to the ``n`` scores rather than
+    to the ``n x dim`` codes.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    data = np.asarray(data)
+    if data.dtype == np.float32:
+        scores = data @ query
+    else:
+        scores = np.empty(data.shape[0], dtype=np.float32)
+        buffer = np.empty((min(WIDEN_ROWS, data.shape[0]), data.shape[1]), dtype=np.float32)
+        for start in range(0, data.shape[0], WIDEN_ROWS):
+            block = data[start:start + WIDEN_ROWS]
+            wide = buffer[:block.shape[0]]
+            np.copyto(wide, block, casting="unsafe")
+            np.matmul(wide, query, out=scores[start:start + block.shape[0]])
+    if scales is not None:
+        scores *= np.asarray(scales, dtype=np.float32)
+    return scores
+
+
+def recall_tradeoff(
+    vectors: "np.ndarray", queries: "np.ndarray", k: int = 10
+) -> List[Dict[str, float]]:
+    """
+    Recall@k against exact float32 search and bytes per vector for each mode.
+    Inputs are unit-normalised first, so scores are cosine similarities.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+    vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-8)
+    queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-8)
+    k = min(k, vectors.shape[0])
+    exact_scores = queries @ vectors.T
+    exact = np.argpartition(-exact_scores, k - 1, axis=1)[:, :k]
+
+    report = []
+    for mode in MODES:
+        stored = quantize(vectors, mode)
+        scores = np.stack([stored.dot(q) for q in queries])
+        found = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        hits = sum(len(np.intersect1d(a, b)) for a, b in zip(exact, found))
+        report.append({
+            "mode": mode,
+            "bytes_per_vector": stored.nbytes / len(stored),
+            "compression": vectors.nbytes / stored.nbytes,
+            f"recall@{k}": hits / (k * len(queries)),
+            "max_score_error": float(np.abs(scores - exact_scores).max()),
+        })
+    return report
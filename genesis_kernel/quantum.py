@@ -2,23 +2,78 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
 from .constants import UniversalConstants
 from .love_math import LoveMathematics
 
 # ⚡ RUST ACCELERATION BRIDGE
 # Attempts to load the compiled Rust kernel (legion_core_rs).
 # If missing, falls back to pure Python execution (Scavenger Mode).
-try:
-    import legion_core_rs
-    RUST_AVAILABLE = True
+# The backend can also be forced per engine or with $GENESIS_BACKEND.
+from .backends import RUST_AVAILABLE, lookup, register, resolve_backend, rust_module
+
+if RUST_AVAILABLE:
     print("⚡ RUST ENGINE DETECTED: Quantum Harmonics Accelerating...")
-except ImportError:
-    RUST_AVAILABLE = False
+else:
     print("🐢 RUST NOT FOUND: Fallback to Python Mode.")
 
 
+@lru_cache(maxsize=None)
+def _rs_quantum():
+    return rust_module().QuantumEngineRS()
+
+
+# --- KERNELS (one per backend; see backends.py) ---
+@register("quantum.energy_eigenvalues", "python")
+def _energy_python(engine, levels, omegas):
+    levels, omegas = levels.tolist(), omegas.tolist()
+    if any(n < 0 for n in levels):
+        raise ValueError("Quantum level must be non-negative.")
+    if not all(w > 0 for w in omegas):
+        raise ValueError("Omega must be positive.")
+    if len(omegas) == 1:
+        omegas = omegas * len(levels)
+    hbar = engine.constants.HBAR
+    return [hbar * w * (n + 0.5) for n, w in zip(levels, omegas)]
+
+
+@register("quantum.energy_eigenvalues", "numpy")
+def _energy_numpy(engine, levels, omegas):
+    if (levels < 0).any():
+        raise ValueError("Quantum level must be non-negative.")
+    if not (omegas > 0).all():
+        raise ValueError("Omega must be positive.")
+    return engine.constants.HBAR * omegas * (levels + 0.5)
+
+
+@register("quantum.energy_eigenvalues", "rust")
+def _energy_rust(engine, levels, omegas):
+    # Zero-copy buffers, one FFI call, validated in Rust
+    out = np.empty(levels.size, dtype=np.float64)
+    _rs_quantum().energy_eigenvalue_batch(levels, omegas, out)
+    return out
+
+
+@register("quantum.phi_quantization", "python")
+def _phi_python(engine):
+    quantum_state = int(engine.constants.PHI * 100)
+    nearest_fib = min(engine.fibonacci, key=lambda x: abs(x - quantum_state))
+    return int(engine.constants.PHI * 144_000), nearest_fib
+
+
+@register("quantum.phi_quantization", "rust")
+def _phi_rust(engine):
+    # Rust returns a tuple (base_144k, nearest_fib)
+    return _rs_quantum().phi_quantization()
+
+
 @dataclass
 class QuantumHarmonicEngine:
     """
@@ -28,19 +83,18 @@ class QuantumHarmonicEngine:
 
     constants: UniversalConstants
     love: LoveMathematics
+    backend: Optional[str] = None
     fibonacci: List[int] = field(init=False)
     _rs_engine: Optional[object] = field(init=False, default=None)
 
     def __post_init__(self) -> None:
-        """Initialize the engine, selecting Rust or Python backend."""
-        if RUST_AVAILABLE:
+        """Initialize the engine, selecting the python, numpy or rust backend."""
+        self.backend = resolve_backend(self.backend)
+        if self.backend == "rust":
             # Initialize the High-Performance Rust Engine
-            self._rs_engine = legion_core_rs.QuantumEngineRS()
-            # We still keep a small Python cache for fallback/debug
-            self.fibonacci = self.constants.fibonacci(20)
-        else:
-            # Pure Python Initialization
-            self.fibonacci = self.constants.fibonacci(20)
+            self._rs_engine = _rs_quantum()
+        # We still keep a small Python cache for fallback/debug
+        self.fibonacci = self.constants.fibonacci(20)
 
     def energy_eigenvalue(self, n: int, omega: float = 1.0) -> float:
         """
@@ -52,36 +106,36 @@ class QuantumHarmonicEngine:
         if omega <= 0:
             raise ValueError("Omega must be positive.")
 
-        if RUST_AVAILABLE and self._rs_engine:
-            # 🚀 RUST PATH (Nanosecond Latency)
-            return self._rs_engine.energy_eigenvalue(n, omega)
-        else:
-            # 🐢 PYTHON PATH (Microsecond Latency)
-            return self.constants.HBAR * omega * (n + 0.5)
+        # One scalar is cheaper in Python than an FFI hop into Rust
+        # (benchmarks/quantum_batch.py); use energy_eigenvalues for many.
+        return self.constants.HBAR * omega * (n + 0.5)
+
+    def energy_eigenvalues(self, levels, omegas=1.0) -> "np.ndarray":
+        """
+        Vectorised energy_eigenvalue over arrays of levels and omegas.
+        ``omegas`` may be a scalar or one value per level. Levels must be
+        whole numbers; fractional levels raise instead of being truncated.
+        """
+        levels = np.asarray(levels).reshape(-1)
+        if levels.dtype.kind not in "biu" and not (
+            np.isfinite(levels).all() and (levels == np.trunc(levels)).all()
+        ):
+            raise ValueError("Quantum levels must be integers.")
+        levels = np.ascontiguousarray(levels, dtype=np.int64)
+        omegas = np.ascontiguousarray(omegas, dtype=np.float64).reshape(-1)
+        if omegas.size not in (1, levels.size):
+            raise ValueError("Omegas must be a scalar or match the levels.")
+        _, kernel = lookup("quantum.energy_eigenvalues", self.backend)
+        return np.asarray(kernel(self, levels, omegas), dtype=np.float64)
 
     def phi_quantization(self) -> Dict[str, int]:
         """
         Quantize the Golden Ratio into a base state.
         """
-        if RUST_AVAILABLE and self._rs_engine:
-            # 🚀 RUST PATH
-            # Rust returns a tuple (base_144k, nearest_fib)
-            base_144k, nearest_fib = self._rs_engine.phi_quantization()
-            quantum_state = int(self.constants.PHI * 100) # Quick calc in Python
-            
-            return {
-                "phi_base": base_144k,
-                "quantum_n": quantum_state,
-                "nearest_fib": nearest_fib,
-            }
-        else:
-            # 🐢 PYTHON PATH
-            base_144k = int(self.constants.PHI * 144_000)
-            quantum_state = int(self.constants.PHI * 100)
-            nearest_fib = min(self.fibonacci, key=lambda x: abs(x - quantum_state))
-            
-            return {
-                "phi_base": base_144k,
-                "quantum_n": quantum_state,
-                "nearest_fib": nearest_fib,
-            }
+        _, kernel = lookup("quantum.phi_quantization", self.backend)
+        base_144k, nearest_fib = kernel(self)
+        return {
+            "phi_base": base_144k,
+            "quantum_n": int(self.constants.PHI * 100),
+            "nearest_fib": nearest_fib,
+        }
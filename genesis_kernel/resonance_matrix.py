@@ -0,0 +1,175 @@
+"""Blocked all-pairs resonance engine for large entity sets."""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Tuple
+
+import numpy as np
+
+from .love_math import LoveMathematics
+
+Tile = Tuple[slice, slice, np.ndarray]
+
+# Per-process state for pool workers (set once by the initializer)
+_WORKER: dict = {}
+
+
+def _init_worker(love: LoveMathematics, frequencies: np.ndarray, tile: int) -> None:
+    _WORKER.update(love=love, frequencies=frequencies, tile=tile)
+
+
+def _tile_block(love: LoveMathematics, frequencies: np.ndarray, rows: slice, cols: slice) -> np.ndarray:
+    return love.resonate_pairwise(frequencies[rows, None], frequencies[None, cols])
+
+
+def _band_to_memmap(args: Tuple[int, int, str]) -> int:
+    """Write the upper-triangle tiles of one row band (and their mirrors)."""
+    start, stop, path = args
+    love, freqs, tile = _WORKER["love"], _WORKER["frequencies"], _WORKER["tile"]
+    out = np.load(path, mmap_mode="r+")
+    rows = slice(start, stop)
+    for col in range(start, freqs.size, tile):
+        cols = slice(col, min(col + tile, freqs.size))
+        block = _tile_block(love, freqs, rows, cols)
+        out[rows, cols] = block
+        out[cols, rows] = block.T
+    out.flush()
+    return stop - start
+
+
+def _band_top_k(args: Tuple[int, int, int, bool]) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Top-k columns for one row band, scanning every column tile."""
+    start, stop, k, exclude_self = args
+    love, freqs, tile = _WORKER["love"], _WORKER["frequencies"], _WORKER["tile"]
+    n_rows = stop - start
+    best_scores = np.full((n_rows, 0), -np.inf)
+    best_cols = np.empty((n_rows, 0), dtype=np.int64)
+    row_ids = np.arange(start, stop)
+    for col in range(0, freqs.size, tile):
+        cols = slice(col, min(col + tile, freqs.size))
+        block = _tile_block(love, freqs, slice(start, stop), cols)
+        col_ids = np.arange(cols.start, cols.stop)
+        if exclude_self:
+            block[row_ids[:, None] == col_ids[None, :]] = -np.inf
+        scores = np.concatenate([best_scores, block], axis=1)
+        ids = np.concatenate([best_cols, np.broadcast_to(col_ids, block.shape)], axis=1)
+        if scores.shape[1] > k:
+            keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(scores, keep, axis=1)
+            ids = np.take_along_axis(ids, keep, axis=1)
+        best_scores, best_cols = scores, ids
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    return (start, np.take_along_axis(best_cols, order, axis=1),
+            np.take_along_axis(best_scores, order, axis=1))
+
+
+@dataclass
+class ResonanceMatrixEngine:
+    """
+    ``LoveMathematics.resonate`` between every pair of N entities, one
+    ``tile x tile`` block at a time.
+    Peak working memory is a few tiles (2048² float64 ≈ 32 MB each) whatever
+    N is; the full matrix only ever exists in a memory-mapped file. Row bands
+    are spread over ``workers`` processes for the memmap and top-k modes.
+    """
+
+    love: LoveMathematics
+    tile: int = 2048
+    workers: int = 1
+
+    def _prepare(self, frequencies) -> np.ndarray:
+        if self.tile < 1:
+            raise ValueError("tile must be positive.")
+        return np.ascontiguousarray(frequencies, dtype=np.float64).reshape(-1)
+
+    def _bands(self, n: int) -> Iterator[Tuple[int, int]]:
+        for start in range(0, n, self.tile):
+            yield start, min(start + self.tile, n)
+
+    def _map(self, fn: Callable, freqs: np.ndarray, tasks: list) -> list:
+        if self.workers <= 1:
+            _init_worker(self.love, freqs, self.tile)
+            try:
+                return [fn(task) for task in tasks]
+            finally:
+                _WORKER.clear()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.love, freqs, self.tile),
+        ) as pool:
+            return list(pool.map(fn, tasks))
+
+    def tiles(self, frequencies, symmetric: bool = True) -> Iterator[Tile]:
+        """
+        Yield ``(rows, cols, block)`` tiles.
+        Resonance is symmetric, so by default only tiles on or above the
+        diagonal are produced; tile ``(cols, rows)`` is ``block.T``.
+        """
+        freqs = self._prepare(frequencies)
+        for start, stop in self._bands(freqs.size):
+            first = start if symmetric else 0
+            for col in range(first, freqs.size, self.tile):
+                rows, cols = slice(start, stop), slice(col, min(col + self.tile, freqs.size))
+                yield rows, cols, _tile_block(self.love, freqs, rows, cols)
+
+    def stream(self, frequencies, callback: Callable[[slice, slice, np.ndarray], None],
+               symmetric: bool = True) -> int:
+        """Feed every tile to ``callback``; return the number of tiles."""
+        count = 0
+        for rows, cols, block in self.tiles(frequencies, symmetric=symmetric):
+            callback(rows, cols, block)
+            count += 1
+        return count
+
+    def to_memmap(self, frequencies, path: str | Path, dtype: str = "float32") -> np.memmap:
+        """Write the full ``(N, N)`` matrix to a ``.npy`` file and map it read-only."""
+        freqs = self._prepare(frequencies)
+        path = str(path)
+        np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(freqs.size, freqs.size)).flush()
+        self._map(_band_to_memmap, freqs, [(a, b, path) for a, b in self._bands(freqs.size)])
+        return np.load(path, mmap_mode="r")
+
+    def top_k(self, frequencies, k: int = 10, exclude_self: bool = True,
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The ``k`` most resonant partners of every entity.
+        Returns ``(indices, scores)``, both ``(N, k)`` and sorted best first;
+        only ``tile x (tile + k)`` scores are held per band.
+        """
+        freqs = self._prepare(frequencies)
+        k = min(k, freqs.size - (1 if exclude_self else 0))
+        if k <= 0:
+            return np.empty((freqs.size, 0), np.int64), np.empty((freqs.size, 0))
+        indices = np.empty((freqs.size, k), dtype=np.int64)
+        scores = np.empty((freqs.size, k))
+        tasks = [(a, b, k, exclude_self) for a, b in self._bands(freqs.size)]
+        for start, band_ids, band_scores in self._map(_band_top_k, freqs, tasks):
+            indices[start:start + band_ids.shape[0]] = band_ids
+            scores[start:start + band_ids.shape[0]] = band_scores
+        return indices, scores
+
+    def clusters(self, frequencies, threshold: float = 0.9, k: int = 10) -> list:
+        """
+        Harmonic clusters: connected groups linked by top-k partners whose
+        resonance is at least ``threshold`` (union-find over the top-k graph).
+        """
+        indices, scores = self.top_k(frequencies, k)
+        parent = np.arange(indices.shape[0])
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in zip(*np.nonzero(scores >= threshold)):
+            a, b = find(i), find(int(indices[i, j]))
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+        groups: dict = {}
+        for i in range(indices.shape[0]):
+            groups.setdefault(find(i), []).append(i)
+        return [g for g in groups.values() if len(g) > 1]
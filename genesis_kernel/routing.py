@@ -0,0 +1,254 @@
+"""Weighted-graph mycelial router with incremental updates and a path cache."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+try:
+    import networkx as nx
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    nx = None
+
+from .csr_graph import CSRGraph, np
+
+ROUTER_BACKENDS = ("auto", "networkx", "csr")
+
+Node = Hashable
+QueryKey = Tuple[Node, Node, int, bool, float]
+
+
+def _check_latency(latency: float) -> float:
+    # Dijkstra and delta-stepping both assume non-negative edge costs;
+    # written so NaN fails too
+    if not latency >= 0:
+        raise ValueError("latency must be non-negative.")
+    return float(latency)
+
+
+def redundancy_for(stress_level: float) -> int:
+    """Paths to keep open: one when calm, three under stress (slime-mold rule)."""
+    return 1 if max(0.0, min(1.0, stress_level)) < 0.5 else 3
+
+
+@dataclass(frozen=True)
+class Route:
+    """One path through the mesh with its total latency and bottleneck capacity."""
+
+    path: Tuple[Node, ...]
+    latency: float
+    capacity: float
+
+    def describe(self) -> Dict[str, object]:
+        return {"path": list(self.path), "latency": self.latency, "capacity": self.capacity}
+
+
+class MycelialRouter:
+    """
+    Undirected mesh whose edges carry ``latency`` (path cost) and
+    ``capacity`` (bottleneck filter). ``routes`` returns the k shortest
+    simple paths, or k edge-disjoint ones so a single cut cannot sever every
+    route. Results are cached per query and invalidated incrementally: an
+    edge that disappears or gets worse only evicts the cached routes through
+    it, while anything that could open a shorter path clears the cache.
+    The NetworkX graph stays the editable source of truth; at or above
+    ``csr_threshold`` nodes ("auto"), single-path and disjoint queries run on
+    a ``CSRGraph`` snapshot. Edge removals and re-weights patch the
+    snapshot in place; new nodes or edges rebuild it on the next query.
+    """
+
+    csr_threshold = 2_000
+
+    def __init__(self, backend: str = "auto") -> None:
+        if nx is None:
+            raise RuntimeError("MycelialRouter requires networkx.")
+        if backend not in ROUTER_BACKENDS:
+            raise ValueError(f"backend must be one of {ROUTER_BACKENDS}, got {backend!r}.")
+        if backend == "csr" and np is None:
+            raise RuntimeError("The csr routing backend requires numpy.")
+        self.backend = backend
+        self.graph = nx.Graph()
+        self.version = 0
+        self._csr: Optional[CSRGraph] = None
+        self._cache: Dict[QueryKey, List[Route]] = {}
+        self._by_edge: Dict[frozenset, Set[QueryKey]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return self.graph.number_of_nodes()
+
+    # --- topology ---
+    def add_node(self, node: Node, value: float = 0.0) -> None:
+        # A new, unconnected node cannot change any existing route
+        if node not in self.graph:
+            self._csr = None
+        self.graph.add_node(node, value=value)
+
+    def remove_node(self, node: Node) -> None:
+        for neighbour in list(self.graph.neighbors(node)):
+            self._evict_edge(node, neighbour)
+        self.graph.remove_node(node)
+        self._evict_node(node)
+        self._csr = None
+        self.version += 1
+
+    def add_edge(self, u: Node, v: Node, latency: float = 1.0, capacity: float = 1.0) -> None:
+        _check_latency(latency)
+        if self.graph.has_edge(u, v):
+            self.update_edge(u, v, latency=latency, capacity=capacity)
+            return
+        self.graph.add_edge(u, v, latency=float(latency), capacity=float(capacity))
+        self._csr = None
+        self._clear()
+
+    def add_edges(self, edges: Iterable[Tuple[Node, Node, float, float]]) -> None:
+        """Bulk ``(u, v, latency, capacity)`` load; clears the cache once."""
+        batch = [(u, v, {"latency": _check_latency(lat), "capacity": float(cap)})
+                 for u, v, lat, cap in edges]
+        self.graph.add_edges_from(batch)
+        self._csr = None
+        self._clear()
+
+    def update_edge(self, u: Node, v: Node, latency: Optional[float] = None,
+                    capacity: Optional[float] = None) -> None:
+        if latency is not None:
+            _check_latency(latency)
+        data = self.graph.edges[u, v]
+        worse = better = False
+        if latency is not None:
+            worse |= latency > data["latency"]
+            better |= latency < data["latency"]
+            data["latency"] = float(latency)
+        if capacity is not None:
+            worse |= capacity < data["capacity"]
+            better |= capacity > data["capacity"]
+            data["capacity"] = float(capacity)
+        if self._csr is not None:
+            self._csr.set_edge(u, v, latency=data["latency"], capacity=data["capacity"])
+        if better:
+            self._clear()
+        elif worse:
+            self._evict_edge(u, v)
+            self.version += 1
+
+    def remove_edge(self, u: Node, v: Node) -> None:
+        self.graph.remove_edge(u, v)
+        if self._csr is not None:
+            self._csr.remove_edge(u, v)
+        self._evict_edge(u, v)
+        self.version += 1
+
+    # --- queries ---
+    def routes(self, source: Node, target: Node, k: int = 1, disjoint: bool = False,
+               min_capacity: float = 0.0) -> List[Route]:
+        """
+        Up to ``k`` routes from ``source`` to ``target``, shortest first,
+        skipping edges whose capacity is below ``min_capacity``. A node
+        routed to itself gets the single empty route ``(source,)``.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        key = (source, target, k, disjoint, float(min_capacity))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        for node in (source, target):
+            if node not in self.graph:
+                raise nx.NodeNotFound(f"Node {node!r} is not in the mesh.")
+        if source == target:
+            return [Route((source,), 0.0, float("inf"))]
+        csr = self.csr_snapshot() if disjoint or k == 1 else None
+        if csr is not None:
+            found = [Route(tuple(path), latency, capacity)
+                     for latency, path, capacity, _ in csr.disjoint_paths(source, target, k, min_capacity)]
+        elif disjoint:
+            found = self._disjoint(source, target, k, min_capacity)
+        else:
+            found = self._shortest(source, target, k, min_capacity)
+        self._cache[key] = found
+        for route in found:
+            for edge in zip(route.path, route.path[1:]):
+                self._by_edge.setdefault(frozenset(edge), set()).add(key)
+        return found
+
+    def route(self, source: Node, target: Node, stress_level: float,
+              min_capacity: float = 0.0) -> List[Route]:
+        """
+        Stress-aware routing: the single shortest path when calm, several
+        edge-disjoint paths (``redundancy_for``) under stress.
+        """
+        redundancy = redundancy_for(stress_level)
+        return self.routes(source, target, k=redundancy, disjoint=redundancy > 1,
+                           min_capacity=min_capacity)
+
+    def uses_csr(self) -> bool:
+        if self.backend == "auto":
+            return np is not None and self.graph.number_of_nodes() >= self.csr_threshold
+        return self.backend == "csr"
+
+    def csr_snapshot(self) -> Optional[CSRGraph]:
+        """The ``CSRGraph`` queries run on, or None on the NetworkX path."""
+        if not self.uses_csr():
+            return None
+        if self._csr is None:
+            self._csr = CSRGraph.from_networkx(self.graph)
+        return self._csr
+
+    def _weight(self, min_capacity: float, banned: Optional[Set[Tuple[Node, Node]]] = None):
+        def weight(u, v, data):
+            if data["capacity"] < min_capacity or (banned and (u, v) in banned):
+                return None  # hides the edge from the search
+            return data["latency"]
+        return weight
+
+    def _make_route(self, path: List[Node]) -> Route:
+        edges = [self.graph.edges[u, v] for u, v in zip(path, path[1:])]
+        return Route(
+            tuple(path),
+            sum(e["latency"] for e in edges),
+            min((e["capacity"] for e in edges), default=float("inf")),
+        )
+
+    def _shortest(self, source: Node, target: Node, k: int, min_capacity: float) -> List[Route]:
+        paths = nx.shortest_simple_paths(self.graph, source, target, weight=self._weight(min_capacity))
+        try:
+            return [self._make_route(p) for p in islice(paths, k)]
+        except nx.NetworkXNoPath:
+            return []
+
+    def _disjoint(self, source: Node, target: Node, k: int, min_capacity: float) -> List[Route]:
+        # Greedy: take the shortest path, ban its edges, repeat
+        found: List[Route] = []
+        banned: Set[Tuple[Node, Node]] = set()
+        for _ in range(k):
+            try:
+                _, path = nx.bidirectional_dijkstra(self.graph, source, target,
+                                                    weight=self._weight(min_capacity, banned))
+            except nx.NetworkXNoPath:
+                break
+            found.append(self._make_route(path))
+            for u, v in zip(path, path[1:]):
+                banned.update(((u, v), (v, u)))
+        return found
+
+    # --- cache bookkeeping ---
+    def clear_cache(self) -> None:
+        """Drop every cached route (e.g. to time cold queries)."""
+        self._cache.clear()
+        self._by_edge.clear()
+
+    def _clear(self) -> None:
+        self.clear_cache()
+        self.version += 1
+
+    def _evict_edge(self, u: Node, v: Node) -> None:
+        for key in self._by_edge.pop(frozenset((u, v)), ()):
+            self._cache.pop(key, None)
+
+    def _evict_node(self, node: Node) -> None:
+        # Queries that started or ended at a removed node
+        for key in [k for k in self._cache if node in (k[0], k[1])]:
+            del self._cache[key]
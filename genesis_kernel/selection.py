@@ -0,0 +1,50 @@
+"""Top-k selection without full sorts: a heap for streams, argpartition for arrays."""
+from __future__ import annotations
+
+import heapq
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+T = TypeVar("T")
+
+
+def top_k(items: Iterable[T], k: int, key: Optional[Callable[[T], Any]] = None) -> List[T]:
+    """
+    The ``k`` largest items, best first, in O(n log k) time and O(k) memory.
+    Same result as ``sorted(items, key=key, reverse=True)[:k]`` (ties keep
+    arrival order), but ``items`` may be a generator that is never
+    materialised.
+    """
+    if k <= 0:
+        return []
+    return heapq.nlargest(k, items, key=key)
+
+
+def top_k_indices(values, k: int) -> "np.ndarray":
+    """
+    Indices of the ``k`` largest entries of a 1-D array, best first.
+    ``argpartition`` finds the cut-off value in O(n) and only the ``k``
+    winners are sorted. Ties resolve to the lowest indices, matching a
+    stable descending sort.
+    """
+    values = np.asarray(values).reshape(-1)
+    k = max(0, min(k, values.size))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < values.size:
+        # Partition from the top rather than negating: -values wraps for
+        # unsigned dtypes
+        cut = values.size - k
+        cutoff = values[np.argpartition(values, cut)[cut]]
+        above = np.flatnonzero(values > cutoff)
+        tied = np.flatnonzero(values == cutoff)[: k - above.size]
+        picked = np.concatenate([above, tied])
+    else:
+        picked = np.arange(values.size)
+    # Best first; equal values in index order
+    return picked[np.lexsort((-picked, values[picked]))[::-1]]
+
@@ -0,0 +1,234 @@
+"""ASGI service exposing the Genesis Kernel (aether-gateway + quantum-engine)."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    from fastapi import FastAPI, HTTPException
+    from fastapi.concurrency import run_in_threadpool
+    from pydantic import BaseModel
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    FastAPI = HTTPException = run_in_threadpool = None
+    BaseModel = object
+
+from .app import GenesisKernel
+
+_STOP = object()  # queued by MicroBatcher.stop() behind the last request
+
+
+@dataclass
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into one batched call.
+    The first queued item opens a window of ``max_latency_ms``; everything
+    that arrives before it closes (up to ``max_batch`` items) is handed to
+    ``handler`` together on a single worker thread, so one model forward pass
+    serves the whole group. If that call raises, the items are retried one
+    at a time so only the failing request gets the error. ``stop()`` serves
+    everything already queued before the worker exits.
+    """
+
+    handler: Callable[[List[Any]], Sequence[Any]]
+    max_batch: int = 64
+    max_latency_ms: float = 5.0
+    batches: int = 0
+    items: int = 0
+    _queue: Optional[asyncio.Queue] = field(init=False, default=None)
+    _task: Optional[asyncio.Task] = field(init=False, default=None)
+    _executor: ThreadPoolExecutor = field(
+        init=False, default_factory=lambda: ThreadPoolExecutor(max_workers=1)
+    )
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Drain the queue, then shut the worker down; later submits fail."""
+        task, self._task = self._task, None
+        if task is not None:
+            await self._queue.put((_STOP, None))
+            await task
+        self._executor.shutdown(wait=True)
+
+    async def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn`` on the batch worker, serialised with the batches."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def submit(self, item: Any) -> Any:
+        if self._task is None:
+            raise RuntimeError("MicroBatcher is not running.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_latency_ms / 1000
+        while len(batch) < self.max_batch and batch[-1][0] is not _STOP:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = await self._collect()
+            if batch[-1][0] is _STOP:
+                batch.pop()
+                stopping = True
+                if not batch:
+                    break
+            await self._serve(batch)
+
+    async def _serve(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.handler, items
+            )
+        except Exception as exc:
+            if len(batch) > 1:
+                # Retry one by one so only the failing request sees the error
+                for entry in batch:
+                    await self._serve([entry])
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(exc)
+            return
+        self.batches += 1
+        self.items += len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch": self.items / self.batches if self.batches else 0.0,
+            "max_batch": self.max_batch,
+            "max_latency_ms": self.max_latency_ms,
+        }
+
+
+class SynthesisRequest(BaseModel):
+    logic_input: str
+    creative_input: str
+
+
+class SynthesisBatchRequest(BaseModel):
+    pairs: List[Tuple[str, str]]
+
+
+class RoutingNode(BaseModel):
+    id: Union[int, str]
+    value: float
+
+
+class RoutingRequest(BaseModel):
+    nodes: List[RoutingNode]
+    stress_level: float
+    max_nodes: int = 5
+
+
+def create_app(
+    kernel: Optional[GenesisKernel] = None,
+    max_batch: int = 64,
+    max_latency_ms: float = 5.0,
+) -> "FastAPI":
+    """Build the ASGI app around a kernel (booted on demand)."""
+    if FastAPI is None:
+        raise RuntimeError("The kernel service requires fastapi and pydantic.")
+    kernel = kernel or GenesisKernel.boot()
+    batcher = MicroBatcher(
+        kernel.aether.bicameral_synthesis_batch,
+        max_batch=max_batch,
+        max_latency_ms=max_latency_ms,
+    )
+
+    @asynccontextmanager
+    async def lifespan(_app):
+        batcher.start()
+        yield
+        await batcher.stop()
+        kernel.oubliette.close()
+
+    app = FastAPI(title="Genesis Kernel", version="2.1", lifespan=lifespan)
+    app.state.kernel = kernel
+    app.state.batcher = batcher
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {"status": "TRANSCENDENT", "batching": batcher.stats()}
+
+    @app.post("/synthesis")
+    async def synthesis(request: SynthesisRequest) -> Dict[str, Any]:
+        return await batcher.submit((request.logic_input, request.creative_input))
+
+    @app.post("/synthesis/batch")
+    async def synthesis_batch(request: SynthesisBatchRequest) -> List[Dict[str, Any]]:
+        return await batcher.call(kernel.aether.bicameral_synthesis_batch, request.pairs)
+
+    @app.get("/quantum/energy")
+    async def energy(n: int, omega: float = 1.0) -> Dict[str, Any]:
+        try:
+            return {"n": n, "omega": omega, "energy": kernel.quantum.energy_eigenvalue(n, omega)}
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+
+    @app.post("/routing")
+    async def routing(request: RoutingRequest) -> Dict[str, Any]:
+        return await run_in_threadpool(
+            kernel.bio.mycelial_route_optimize,
+            [node.model_dump() for node in request.nodes],
+            request.stress_level,
+            max_nodes=request.max_nodes,
+        )
+
+    @app.get("/recall/similar")
+    async def recall_similar(text: str, k: int = 5) -> List[Dict[str, Any]]:
+        try:
+            return await batcher.call(kernel.aether.recall_similar, text, k)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+        except RuntimeError as exc:
+            raise HTTPException(status_code=503, detail=str(exc))
+
+    @app.get("/recall/{synthesis_id}")
+    async def recall(synthesis_id: str) -> Dict[str, Any]:
+        engram = await run_in_threadpool(kernel.oubliette.lookup, synthesis_id)
+        if engram is None:
+            raise HTTPException(status_code=404, detail="Thought not in the Oubliette.")
+        return engram
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    app = create_app(
+        max_batch=int(os.environ.get("GENESIS_MAX_BATCH", "64")),
+        max_latency_ms=float(os.environ.get("GENESIS_MAX_LATENCY_MS", "5")),
+    )
+    uvicorn.run(
+        app,
+        host=os.environ.get("GENESIS_HOST", "0.0.0.0"),
+        port=int(os.environ.get("GENESIS_PORT", "8000")),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+// legion_core_rs/src/lib.rs
+use pyo3::buffer::{Element, PyBuffer};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use std::f64::consts::PI;
+
+// 1. UNIVERSAL CONSTANTS (Hardcoded in Rust for Speed)
+const PHI: f64 = 1.618033988749895;
+const HBAR: f64 = 6.62607015e-34 / (2.0 * PI); // same derivation as constants.py
+const LOVE_FREQ: f64 = 528.0;
+// pi * (3 - sqrt(5)): the phyllotaxis (sunflower) angle in radians
+const GOLDEN_ANGLE: f64 = 2.399963229728653;
+
+// 2. BUFFER ACCESS (zero-copy views of C-contiguous NumPy arrays)
+fn read_slice<'a, T: Element>(buf: &'a PyBuffer<T>, name: &str) -> PyResult<&'a [T]> {
+    if !buf.is_c_contiguous() {
+        return Err(PyValueError::new_err(format!("{name} must be a C-contiguous array")));
+    }
+    // SAFETY: PyBuffer<T> checked the item type; the buffer is contiguous and
+    // stays alive for the borrow
+    Ok(unsafe { std::slice::from_raw_parts(buf.buf_ptr() as *const T, buf.item_count()) })
+}
+
+fn write_slice<'a, T: Element>(buf: &'a PyBuffer<T>, name: &str) -> PyResult<&'a mut [T]> {
+    if buf.readonly() || !buf.is_c_contiguous() {
+        return Err(PyValueError::new_err(format!("{name} must be a writable C-contiguous array")));
+    }
+    // SAFETY: as above, and the caller hands the output array over for this call
+    Ok(unsafe { std::slice::from_raw_parts_mut(buf.buf_ptr() as *mut T, buf.item_count()) })
+}
+
+// 3. CHUNKED EXECUTION (optionally split across Rayon threads)
+// Items per parallel task; arrays shorter than this run on the calling thread.
+#[cfg(feature = "parallel")]
+const PAR_CHUNK: usize = 1 << 15;
+
+// Run `kernel(first_item, out_chunk)` over `out`, which holds `width` values
+// per item. Callers run this inside `allow_threads`, so it must not touch
+// Python objects.
+fn run_chunked<F>(out: &mut [f64], width: usize, kernel: F)
+where
+    F: Fn(usize, &mut [f64]) + Send + Sync,
+{
+    #[cfg(feature = "parallel")]
+    if out.len() > PAR_CHUNK * width {
+        use rayon::prelude::*;
+        out.par_chunks_mut(PAR_CHUNK * width)
+            .enumerate()
+            .for_each(|(i, chunk)| kernel(i * PAR_CHUNK, chunk));
+        return;
+    }
+    let _ = width;
+    kernel(0, out);
+}
+
+fn check_len(name: &str, got: usize, want: usize) -> PyResult<()> {
+    if got != want {
+        return Err(PyValueError::new_err(format!("{name} has {got} items, expected {want}")));
+    }
+    Ok(())
+}
+
+// 4. RESONANCE + SPIRAL KERNELS (used by infinity_loop.py)
+fn resonance(freq: f64) -> f64 {
+    freq * PHI
+}
+
+fn spiral(resonance: f64, angle: f64) -> (f64, f64, f64) {
+    let r = resonance.max(0.0).sqrt();
+    let theta = resonance * GOLDEN_ANGLE + 2.0 * PI * angle;
+    (r * theta.cos(), r * theta.sin(), resonance / LOVE_FREQ)
+}
+
+/// The PHI-scaled resonance of a base frequency.
+#[pyfunction]
+fn calculate_resonance(freq: f64) -> f64 {
+    resonance(freq)
+}
+
+/// Place a thought on the golden spiral: (x, y, z) from resonance and a
+/// semantic angle in [0, 1).
+#[pyfunction]
+fn map_to_spiral(resonance: f64, angle: f64) -> (f64, f64, f64) {
+    spiral(resonance, angle)
+}
+
+/// calculate_resonance over a float64 array, written into `out`.
+#[pyfunction]
+fn calculate_resonance_batch(py: Python<'_>, freqs: PyBuffer<f64>, out: PyBuffer<f64>) -> PyResult<()> {
+    let freqs = read_slice(&freqs, "freqs")?;
+    let out = write_slice(&out, "out")?;
+    check_len("out", out.len(), freqs.len())?;
+    py.allow_threads(|| {
+        run_chunked(out, 1, |start, chunk| {
+            for (o, &f) in chunk.iter_mut().zip(&freqs[start..]) {
+                *o = resonance(f);
+            }
+        })
+    });
+    Ok(())
+}
+
+/// map_to_spiral over float64 arrays, written into an (n, 3) `out`.
+#[pyfunction]
+fn map_to_spiral_batch(py: Python<'_>, resonances: PyBuffer<f64>, angles: PyBuffer<f64>, out: PyBuffer<f64>) -> PyResult<()> {
+    let resonances = read_slice(&resonances, "resonances")?;
+    let angles = read_slice(&angles, "angles")?;
+    let out = write_slice(&out, "out")?;
+    check_len("angles", angles.len(), resonances.len())?;
+    check_len("out", out.len(), 3 * resonances.len())?;
+    py.allow_threads(|| {
+        run_chunked(out, 3, |start, chunk| {
+            let items = resonances[start..].iter().zip(&angles[start..]);
+            for (xyz, (&res, &angle)) in chunk.chunks_exact_mut(3).zip(items) {
+                let (x, y, z) = spiral(res, angle);
+                xyz[0] = x;
+                xyz[1] = y;
+                xyz[2] = z;
+            }
+        })
+    });
+    Ok(())
+}
+
+// 5. QUANTUM HARMONIC ENGINE (Port of quantum.py)
+#[pyclass]
+struct QuantumEngineRS {
+    fib_cache: Vec<u64>,
+}
+
+#[pymethods]
+impl QuantumEngineRS {
+    #[new]
+    fn new() -> Self {
+        // Pre-calculate Fibonacci for instant lookups
+        let mut fib = vec![0, 1];
+        for i in 0..50 {
+            let next = fib[i] + fib[i+1];
+            fib.push(next);
+        }
+        QuantumEngineRS { fib_cache: fib }
+    }
+
+    // Calculates Energy Eigenvalue 100x faster than Python
+    fn energy_eigenvalue(&self, n: i32, omega: f64) -> PyResult<f64> {
+        Ok(HBAR * omega * (n as f64 + 0.5))
+    }
+
+    // Batch E_n over int64 levels and float64 omegas (one omega broadcasts)
+    fn energy_eigenvalue_batch(&self, py: Python<'_>, levels: PyBuffer<i64>, omegas: PyBuffer<f64>, out: PyBuffer<f64>) -> PyResult<()> {
+        let levels = read_slice(&levels, "levels")?;
+        let omegas = read_slice(&omegas, "omegas")?;
+        let out = write_slice(&out, "out")?;
+        check_len("out", out.len(), levels.len())?;
+        if levels.iter().any(|&n| n < 0) {
+            return Err(PyValueError::new_err("Quantum level must be non-negative."));
+        }
+        if omegas.iter().any(|&w| !(w > 0.0)) {
+            return Err(PyValueError::new_err("Omega must be positive."));
+        }
+        if omegas.len() != 1 {
+            check_len("omegas", omegas.len(), levels.len())?;
+        }
+        py.allow_threads(|| {
+            run_chunked(out, 1, |start, chunk| {
+                let levels = &levels[start..];
+                if let [omega] = omegas {
+                    for (o, &n) in chunk.iter_mut().zip(levels) {
+                        *o = HBAR * omega * (n as f64 + 0.5);
+                    }
+                } else {
+                    for ((o, &n), &omega) in chunk.iter_mut().zip(levels).zip(&omegas[start..]) {
+                        *o = HBAR * omega * (n as f64 + 0.5);
+                    }
+                }
+            })
+        });
+        Ok(())
+    }
+
+    // Quantize Phi instantly
+    fn phi_quantization(&self) -> PyResult<(u64, u64)> {
+        let base_144k = (PHI * 144_000.0) as u64;
+        let quantum_state = (PHI * 100.0) as u64;
+        // Find nearest fib (Rust vector search is blazing fast)
+        let nearest_fib = self.fib_cache.iter()
+            .min_by_key(|&x| ((*x as i64) - (quantum_state as i64)).abs())
+            .unwrap();
+
+        Ok((base_144k, *nearest_fib))
+    }
+}
+
+// 6. PATTERN PROGRAMS (stack bytecode from genesis_kernel/pattern_compiler.py)
+const OP_INPUT: i64 = 0;
+const OP_CONST: i64 = 1;
+const OP_DUP: i64 = 2;
+const OP_ADD: i64 = 3;
+const OP_SUB: i64 = 4;
+const OP_MUL: i64 = 5;
+const OP_NEG: i64 = 6;
+const OP_SWAP: i64 = 7;
+const OP_POP: i64 = 8;
+const MAX_STACK: usize = 16;
+
+#[derive(Clone, Copy)]
+enum Instr {
+    Input,
+    Const(f64),
+    Dup,
+    Neg,
+    Swap,
+    Pop,
+    Bin(i64),
+    // Peephole fusions of Const/Input/Dup followed by a binary op: the right
+    // operand is read in place instead of being pushed first
+    BinConst(i64, f64),
+    BinInput(i64),
+    BinSelf(i64),
+}
+
+// Check stack depth and constant indices once, so the block loop can run
+// without bounds errors, then fuse operand pushes into binary ops
+fn compile_program(codes: &[i64], consts: &[f64]) -> PyResult<Vec<Instr>> {
+    if codes.len() % 2 != 0 {
+        return Err(PyValueError::new_err("codes must hold (opcode, argument) pairs"));
+    }
+    let mut depth = 0usize;
+    let mut program: Vec<Instr> = Vec::with_capacity(codes.len() / 2);
+    for pair in codes.chunks_exact(2) {
+        let (op, arg) = (pair[0], pair[1]);
+        let (pops, pushes, instr) = match op {
+            OP_INPUT => (0, 1, Instr::Input),
+            OP_CONST if arg >= 0 && (arg as usize) < consts.len() => (0, 1, Instr::Const(consts[arg as usize])),
+            OP_CONST => return Err(PyValueError::new_err(format!("constant index {arg} out of range"))),
+            OP_DUP => (1, 2, Instr::Dup),
+            OP_ADD | OP_SUB | OP_MUL => (2, 1, Instr::Bin(op)),
+            OP_SWAP => (2, 2, Instr::Swap),
+            OP_NEG => (1, 1, Instr::Neg),
+            OP_POP => (1, 0, Instr::Pop),
+            _ => return Err(PyValueError::new_err(format!("unknown opcode {op}"))),
+        };
+        if depth < pops || depth - pops + pushes > MAX_STACK {
+            return Err(PyValueError::new_err("program under- or overflows the stack"));
+        }
+        depth = depth - pops + pushes;
+        let fused = match (program.last(), instr) {
+            (Some(Instr::Const(c)), Instr::Bin(op)) => Some(Instr::BinConst(op, *c)),
+            (Some(Instr::Input), Instr::Bin(op)) => Some(Instr::BinInput(op)),
+            (Some(Instr::Dup), Instr::Bin(op)) => Some(Instr::BinSelf(op)),
+            _ => None,
+        };
+        match fused {
+            Some(f) => *program.last_mut().unwrap() = f,
+            None => program.push(instr),
+        }
+    }
+    if depth == 0 {
+        return Err(PyValueError::new_err("program leaves no result on the stack"));
+    }
+    Ok(program)
+}
+
+// Items per interpreter block: each instruction is dispatched once per block
+// and then runs as a tight (auto-vectorised) loop over it
+const PROGRAM_BLOCK: usize = 256;
+type ProgramStack = [[f64; PROGRAM_BLOCK]; MAX_STACK];
+
+fn apply_bin(op: i64, a: &mut [f64], b: impl Iterator<Item = f64>) {
+    match op {
+        OP_ADD => a.iter_mut().zip(b).for_each(|(a, b)| *a += b),
+        OP_SUB => a.iter_mut().zip(b).for_each(|(a, b)| *a -= b),
+        _ => a.iter_mut().zip(b).for_each(|(a, b)| *a *= b),
+    }
+}
+
+fn run_program_block(program: &[Instr], stack: &mut ProgramStack, xs: &[f64], out: &mut [f64]) {
+    let n = xs.len();
+    let mut sp = 0usize;
+    for &instr in program {
+        match instr {
+            Instr::Input => {
+                stack[sp][..n].copy_from_slice(xs);
+                sp += 1;
+            }
+            Instr::Const(c) => {
+                stack[sp][..n].fill(c);
+                sp += 1;
+            }
+            Instr::Dup => {
+                let (below, above) = stack.split_at_mut(sp);
+                above[0][..n].copy_from_slice(&below[sp - 1][..n]);
+                sp += 1;
+            }
+            Instr::Neg => stack[sp - 1][..n].iter_mut().for_each(|v| *v = -*v),
+            Instr::Swap => stack.swap(sp - 1, sp - 2),
+            Instr::Pop => sp -= 1,
+            Instr::Bin(op) => {
+                sp -= 1;
+                let (below, top) = stack.split_at_mut(sp);
+                apply_bin(op, &mut below[sp - 1][..n], top[0][..n].iter().copied());
+            }
+            Instr::BinConst(op, c) => apply_bin(op, &mut stack[sp - 1][..n], std::iter::repeat(c)),
+            Instr::BinInput(op) => apply_bin(op, &mut stack[sp - 1][..n], xs.iter().copied()),
+            Instr::BinSelf(op) => {
+                let a = &mut stack[sp - 1][..n];
+                match op {
+                    OP_ADD => a.iter_mut().for_each(|v| *v += *v),
+                    OP_SUB => a.iter_mut().for_each(|v| *v -= *v),
+                    _ => a.iter_mut().for_each(|v| *v *= *v),
+                }
+            }
+        }
+    }
+    out.copy_from_slice(&stack[sp - 1][..n]);
+}
+
+// 7. PATTERN MATH ENGINE (Port of pattern_math.py)
+#[pyclass]
+struct PatternEngineRS {}
+
+#[pymethods]
+impl PatternEngineRS {
+    #[staticmethod]
+    fn quadratic_growth_stream(input_val: f64) -> PyResult<Vec<f64>> {
+        // "Variable-Less" execution trace
+        let square = input_val * input_val;
+        let double = input_val * 2.0;
+        let combine = square + double;
+        let unity = combine + 1.0;
+
+        Ok(vec![input_val, square, double, combine, unity])
+    }
+
+    // quadratic_growth_stream over a float64 array, written into an (n, 5) `out`
+    #[staticmethod]
+    fn quadratic_growth_batch(py: Python<'_>, values: PyBuffer<f64>, out: PyBuffer<f64>) -> PyResult<()> {
+        let values = read_slice(&values, "values")?;
+        let out = write_slice(&out, "out")?;
+        check_len("out", out.len(), 5 * values.len())?;
+        py.allow_threads(|| {
+            run_chunked(out, 5, |start, chunk| {
+                for (row, &x) in chunk.chunks_exact_mut(5).zip(&values[start..]) {
+                    let square = x * x;
+                    let double = x * 2.0;
+                    row.copy_from_slice(&[x, square, double, square + double, square + double + 1.0]);
+                }
+            })
+        });
+        Ok(())
+    }
+
+    // Run a compiled pattern program over `values` into `out` (same length)
+    #[staticmethod]
+    fn run_program(
+        py: Python<'_>,
+        codes: PyBuffer<i64>,
+        consts: PyBuffer<f64>,
+        values: PyBuffer<f64>,
+        out: PyBuffer<f64>,
+    ) -> PyResult<()> {
+        let program = compile_program(read_slice(&codes, "codes")?, read_slice(&consts, "consts")?)?;
+        let values = read_slice(&values, "values")?;
+        let out = write_slice(&out, "out")?;
+        check_len("out", out.len(), values.len())?;
+        py.allow_threads(|| {
+            run_chunked(out, 1, |start, chunk| {
+                let mut stack: Box<ProgramStack> = Box::new([[0.0; PROGRAM_BLOCK]; MAX_STACK]);
+                for (i, block) in chunk.chunks_mut(PROGRAM_BLOCK).enumerate() {
+                    let first = start + i * PROGRAM_BLOCK;
+                    run_program_block(&program, &mut stack, &values[first..first + block.len()], block);
+                }
+            })
+        });
+        Ok(())
+    }
+}
+
+// EXPOSE TO PYTHON
+#[pymodule]
+fn legion_core_rs(_py: Python, m: &PyModule) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(calculate_resonance, m)?)?;
+    m.add_function(wrap_pyfunction!(map_to_spiral, m)?)?;
+    m.add_function(wrap_pyfunction!(calculate_resonance_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(map_to_spiral_batch, m)?)?;
+    m.add_class::<QuantumEngineRS>()?;
+    m.add_class::<PatternEngineRS>()?;
+    Ok(())
+}